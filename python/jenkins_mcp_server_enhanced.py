@@ -3,25 +3,38 @@
 import os
 import sys
 import argparse
+import asyncio
+import atexit
 import logging
-from typing import Optional, Dict, List, Union, Any, Tuple, Set
+from typing import Optional, Dict, List, Union, Any, Tuple, Callable
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from dotenv import load_dotenv
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlencode, quote
 import uuid
-from fastapi import status
-from fastapi.responses import JSONResponse
+import itertools
 import threading
-from datetime import datetime, timedelta
+from datetime import datetime
 import fnmatch
 import time
 import random
 import re
-from functools import wraps
-from cachetools import TTLCache, LRUCache, cached
-from cachetools.keys import hashkey
+import string
+from functools import wraps, lru_cache
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from cachetools import TTLCache, LRUCache
+
+# orjson is an optional speedup for decoding large Jenkins responses
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 # Load environment variables
 load_dotenv()
@@ -62,7 +75,13 @@ class JenkinsConfig:
         JENKINS_RETRY_BACKOFF_MULTIPLIER: Backoff multiplier for exponential backoff (default: 2.0)
         JENKINS_DEFAULT_TIMEOUT: Default request timeout in seconds (default: 10)
         JENKINS_HEALTH_TIMEOUT: Health check timeout in seconds (default: 5)
+        JENKINS_CONNECT_TIMEOUT: Connect timeout for API requests in seconds (default: 5)
+        JENKINS_READ_TIMEOUT: Read timeout for API requests in seconds (default: 30)
+        JENKINS_POOL_CONNECTIONS: Number of per-host connection pools to cache (default: 4)
+        JENKINS_POOL_MAXSIZE: Maximum connections kept per host (default: max(10, CPU count * 5))
+        JENKINS_CRAWL_WORKERS: Maximum concurrent folder requests during a folder crawl (default: 16)
         JENKINS_CRUMB_CACHE_MINUTES: CSRF crumb cache duration in minutes (default: 30)
+        JENKINS_TREE_TTL_SECONDS: How long a recursive job tree crawl is reused in seconds (default: 60)
         JENKINS_MAX_LOG_SIZE: Maximum log content size in characters (default: 1000)
         JENKINS_MAX_CONTENT_SIZE: Maximum content size in characters (default: 10000)
         JENKINS_MAX_ARTIFACT_SIZE_MB: Maximum artifact download size in MB (default: 50)
@@ -86,9 +105,17 @@ class JenkinsConfig:
     # Request Timeouts
     DEFAULT_TIMEOUT = int(os.getenv("JENKINS_DEFAULT_TIMEOUT", "10"))
     HEALTH_CHECK_TIMEOUT = int(os.getenv("JENKINS_HEALTH_TIMEOUT", "5"))
+    CONNECT_TIMEOUT = float(os.getenv("JENKINS_CONNECT_TIMEOUT", "5"))
+    READ_TIMEOUT = float(os.getenv("JENKINS_READ_TIMEOUT", "30"))
+    
+    # Connection Pool (sized for concurrent tool calls against a single Jenkins host)
+    POOL_CONNECTIONS = int(os.getenv("JENKINS_POOL_CONNECTIONS", "4"))
+    POOL_MAXSIZE = int(os.getenv("JENKINS_POOL_MAXSIZE", str(max(10, (os.cpu_count() or 4) * 5))))
+    CRAWL_WORKERS = int(os.getenv("JENKINS_CRAWL_WORKERS", "16"))
     
     # Cache Configuration
     CRUMB_CACHE_MINUTES = int(os.getenv("JENKINS_CRUMB_CACHE_MINUTES", "30"))
+    TREE_CACHE_TTL = int(os.getenv("JENKINS_TREE_TTL_SECONDS", "60"))
     
     # Performance Cache Settings
     CACHE_STATIC_TTL = int(os.getenv("JENKINS_CACHE_STATIC_TTL", "3600"))        # 1 hour for static data
@@ -232,9 +259,9 @@ def create_error_response(error: Union[Exception, JenkinsError],
         }
     
     # Log the error
-    logger.error(f"[{request_id}] {operation} failed: {response['error']}")
+    logger.error("[%s] %s failed: %s", request_id, operation, response['error'])
     if 'suggestion' in response:
-        logger.info(f"[{request_id}] Suggestion: {response['suggestion']}")
+        logger.info("[%s] Suggestion: %s", request_id, response['suggestion'])
     
     return response
 
@@ -309,7 +336,7 @@ def with_retry(max_retries: int = DEFAULT_MAX_RETRIES,
                     
                     # If we get here, the request succeeded (no exception)
                     if attempt > 0:
-                        logger.info(f"[{request_id}] Request succeeded on attempt {attempt + 1}")
+                        logger.info("[%s] Request succeeded on attempt %s", request_id, attempt + 1)
                     return response
                     
                 except requests.exceptions.HTTPError as e:
@@ -325,8 +352,8 @@ def with_retry(max_retries: int = DEFAULT_MAX_RETRIES,
                             jitter = random.uniform(0.1, 0.9) * delay
                             total_delay = delay + jitter
                             
-                            logger.warning(f"[{request_id}] HTTP {e.response.status_code} error on attempt {attempt + 1}, "
-                                         f"retrying in {total_delay:.2f}s...")
+                            logger.warning("[%s] HTTP %s error on attempt %s, retrying in %.2fs...",
+                                           request_id, e.response.status_code, attempt + 1, total_delay)
                             time.sleep(total_delay)
                             continue
                     
@@ -340,8 +367,8 @@ def with_retry(max_retries: int = DEFAULT_MAX_RETRIES,
                         jitter = random.uniform(0.1, 0.9) * delay
                         total_delay = delay + jitter
                         
-                        logger.warning(f"[{request_id}] Network error on attempt {attempt + 1}: {str(e)}, "
-                                     f"retrying in {total_delay:.2f}s...")
+                        logger.warning("[%s] Network error on attempt %s: %s, retrying in %.2fs...",
+                                       request_id, attempt + 1, e, total_delay)
                         time.sleep(total_delay)
                         continue
                     
@@ -350,7 +377,7 @@ def with_retry(max_retries: int = DEFAULT_MAX_RETRIES,
                     raise
             
             # If we get here, all retries have been exhausted
-            logger.error(f"[{request_id}] All {max_retries} retry attempts failed")
+            logger.error("[%s] All %s retry attempts failed", request_id, max_retries)
             raise last_exception
         
         return wrapper
@@ -362,6 +389,11 @@ if not JenkinsConfig.USER or not JenkinsConfig.API_TOKEN:
     sys.exit(1)
 
 # --- Common Utilities ---
+# Connection constants, computed once at import
+_JENKINS_AUTH = (JenkinsConfig.USER, JenkinsConfig.API_TOKEN)
+_JENKINS_BASE_URL = JenkinsConfig.URL.rstrip('/')
+_JOB_URL_BASE = f"{_JENKINS_BASE_URL}/job/"
+
 def get_jenkins_auth() -> Tuple[str, str]:
     """
     Get Jenkins authentication tuple for requests.
@@ -369,14 +401,147 @@ def get_jenkins_auth() -> Tuple[str, str]:
     Returns:
         Tuple of (username, api_token)
     """
-    return (JenkinsConfig.USER, JenkinsConfig.API_TOKEN)
+    return _JENKINS_AUTH
 
-# Global CSRF crumb cache
+def _json(resp: requests.Response) -> Any:
+    """Decode a Jenkins JSON response body, using orjson when it is installed."""
+    return _json_loads(resp.content)
+
+@lru_cache(maxsize=4096)
+def _encode_job_path(job_path: str) -> str:
+    """
+    URL-encode a job path like 'folder1/subfolder/jobname' into Jenkins' URL form.
+    
+    Args:
+        job_path: Slash-separated job path
+    
+    Returns:
+        Encoded path with segments joined by '/job/' (e.g. 'folder1/job/subfolder/job/jobname')
+    """
+    return '/job/'.join(quote(part, safe='') for part in job_path.split('/'))
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], bool]:
+    """
+    Compile a shell-style wildcard pattern into a case-insensitive matcher.
+    
+    The pattern is lowercased, so call the matcher with lowercased names.
+    Literal, 'X*', '*X' and '*X*' patterns are answered with plain string
+    operations; anything else is translated to a regex once. Matchers are
+    memoized, so repeated searches skip the classification and compilation.
+    
+    Args:
+        pattern: Wildcard pattern such as 'build*' or '*test*'
+    
+    Returns:
+        Callable returning True where fnmatch.fnmatch(name, pattern) would
+    """
+    pattern = pattern.lower()
+    
+    if '?' not in pattern and '[' not in pattern:
+        leading = pattern.startswith('*')
+        trailing = pattern.endswith('*')
+        core = pattern.strip('*')
+        if '*' not in core:
+            if leading and trailing:
+                return lambda name: core in name
+            if trailing:
+                return lambda name: name.startswith(core)
+            if leading:
+                return lambda name: name.endswith(core)
+            return lambda name: name == core
+    
+    regex_match = re.compile(fnmatch.translate(pattern)).match
+    return lambda name: regex_match(name) is not None
+
+def _glob_folder_prefix(pattern: str) -> str:
+    """
+    Return the literal folder path a wildcard pattern is confined to.
+    
+    A pattern such as 'team/api/*-deploy' can only match items whose full name
+    starts with 'team/api/', since a name without '/' never matches it. For
+    such patterns this returns 'team/api'; otherwise an empty string.
+    """
+    wildcard = len(pattern)
+    for char in '*?[':
+        index = pattern.find(char)
+        if index != -1 and index < wildcard:
+            wildcard = index
+    folder = pattern[:wildcard].rpartition('/')[0]
+    if not folder or '' in folder.split('/'):
+        return ""
+    return folder
+
+def _create_jenkins_session() -> requests.Session:
+    """
+    Create the shared HTTP session used for all Jenkins API calls.
+    
+    A single session keeps TCP connections (and TLS state on HTTPS Jenkins)
+    alive across tool calls instead of reconnecting for every request.
+    
+    Returns:
+        Configured requests.Session with authentication and connection pooling
+    """
+    session = requests.Session()
+    session.auth = get_jenkins_auth()
+    
+    # No transport-level retries: with_retry on jenkins_request already retries
+    # retryable statuses and network errors
+    adapter = HTTPAdapter(
+        pool_connections=JenkinsConfig.POOL_CONNECTIONS,
+        pool_maxsize=JenkinsConfig.POOL_MAXSIZE,
+        pool_block=False
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+# Global HTTP session shared by all Jenkins requests
+_SESSION = _create_jenkins_session()
+atexit.register(_SESSION.close)
+
+# Small shared pool for blocking Jenkins I/O that must not run on the MCP event
+# loop or should overlap with other work (health checks, crumb prefetch)
+_IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="jenkins-io")
+
+# Default (connect, read) timeout for Jenkins API calls; never wait unbounded
+_REQUEST_TIMEOUT = (JenkinsConfig.CONNECT_TIMEOUT, JenkinsConfig.READ_TIMEOUT)
+
+# Read-only headers for form-encoded POSTs (jenkins_request copies before adding the crumb)
+_FORM_HEADERS = MappingProxyType({"Content-Type": "application/x-www-form-urlencoded"})
+
+# Jenkins API tree= projections: request only the fields the parsers read
+_JOB_LIST_TREE = "jobs[name,url,description,_class]"
+_FOLDER_INFO_TREE = f"description,{_JOB_LIST_TREE}"
+_ENHANCED_JOB_INFO_TREE = ("buildable,inQueue,builds[building]{0,5},"
+                           "lastBuild[number,url,result,timestamp,duration],"
+                           "lastSuccessfulBuild[number,url],lastFailedBuild[number,url],lastUnstableBuild[number,url]")
+_JOB_INFO_TREE = ("description,lastBuild[number,result],"
+                  "property[_class,parameterDefinitions[name,type,description,choices,defaultParameterValue[value]]]")
+
+# Global CSRF crumb cache ("expires" is a time.monotonic() deadline)
 _crumb_cache = {
     "token": None,
-    "expires": None,
+    "expires": 0.0,
     "lock": threading.Lock()
 }
+
+# Treat cached crumbs as expired slightly early to avoid using one mid-expiry
+CRUMB_EXPIRY_MARGIN_SECONDS = 30
+
+# Short-lived cache of recursive job tree crawls, shared by list_jobs, search_jobs
+# and get_job_info's search fallback. "entries" maps (root, max_depth) to
+# (expires, version, JobTable) with expires a time.monotonic() deadline; bumping
+# "version" invalidates every entry, including crawls still in flight.
+# "inflight" maps keys being crawled to a Future that concurrent callers wait on.
+_tree_cache = {
+    "entries": {},
+    "inflight": {},
+    "version": 0,
+    "lock": threading.Lock()
+}
+_tree_cache_versions = itertools.count(1)
+
 # --- LLM Integration Resources ---
 
 # This section includes resources, prompts, and sampling configurations for LLM integration.
@@ -397,23 +562,39 @@ LLM_RESOURCES = {
 }
 
 
+# The summarize prompt is filled on every call; parse its placeholder once
+_SUMMARIZE_LOG_TEMPLATE = string.Template(
+    LLM_RESOURCES["prompts"]["summarize_log"].replace("{log_text}", "$log_text")
+)
+
+# Console log windows (in bytes) kept from the start and end of a log for summarization
+SUMMARY_LOG_HEAD_BYTES = 4000
+SUMMARY_LOG_TAIL_BYTES = 20000
+
+
 # Helper to process multiselect parameters
 def process_jenkins_parameters(params: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, str]:
     """
     Process parameters for Jenkins, handling multiselect and other parameter types.
     Jenkins expects all parameters as strings, with multiselect values comma-separated.
+    Parameters that are already all strings are returned as-is without copying.
     """
-    processed_params = {}
+    # Fast path: nothing to convert
+    if all(type(value) is str for value in params.values()):
+        return params
+    
+    processed_params = {
+        key: (','.join(map(str, value)) if isinstance(value, list)
+              else str(value).lower() if isinstance(value, bool)
+              else str(value))
+        for key, value in params.items()
+    }
     
-    for key, value in params.items():
-        if isinstance(value, list):
-            processed_params[key] = ','.join(str(v) for v in value)
-            logger.info(f"[{context['request_id']}] Processed multiselect parameter '{key}': {value} -> '{processed_params[key]}'")
-        elif isinstance(value, bool):
-            processed_params[key] = str(value).lower()
-            logger.info(f"[{context['request_id']}] Processed boolean parameter '{key}': {value} -> '{processed_params[key]}'")
-        else:
-            processed_params[key] = str(value)
+    # Log multiselect/boolean conversions in a single summary line
+    if logger.isEnabledFor(logging.INFO):
+        converted = {key: processed_params[key] for key, value in params.items() if isinstance(value, (list, bool))}
+        if converted:
+            logger.info("[%s] Processed multiselect/boolean parameters: %s", context['request_id'], converted)
     
     return processed_params
 
@@ -551,7 +732,7 @@ class JenkinsCacheManager:
                     pass
             
             self.stats['invalidations'] += 1
-            logger.info(f"Invalidated caches for job: {job_name}")
+            logger.info("Invalidated caches for job: %s", job_name)
     
     def get_cache_for_type(self, cache_type: str):
         """Get the appropriate cache based on data type."""
@@ -597,14 +778,14 @@ def cached_request(cache_type: str = 'dynamic', key_func=None):
             try:
                 result = cache[key]
                 cache_manager.stats['hits'] += 1
-                logger.debug(f"Cache hit for {func.__name__} with key {key}")
+                logger.debug("Cache hit for %s with key %s", func.__name__, key)
                 return result
             except KeyError:
                 # Cache miss, execute function and cache result
                 result = func(*args, **kwargs)
                 cache[key] = result
                 cache_manager.stats['misses'] += 1
-                logger.debug(f"Cache miss for {func.__name__} with key {key}, result cached")
+                logger.debug("Cache miss for %s with key %s, result cached", func.__name__, key)
                 return result
         
         return wrapper
@@ -626,7 +807,7 @@ def smart_build_cache(func):
             # If it's in permanent cache, it's a completed build
             if result.status not in ['BUILDING', 'PENDING', 'UNKNOWN']:
                 cache_manager.stats['hits'] += 1
-                logger.debug(f"Permanent cache hit for {func.__name__} with key {key}")
+                logger.debug("Permanent cache hit for %s with key %s", func.__name__, key)
                 return result
         except KeyError:
             pass
@@ -635,7 +816,7 @@ def smart_build_cache(func):
         try:
             result = cache_manager.dynamic_cache[key]
             cache_manager.stats['hits'] += 1
-            logger.debug(f"Dynamic cache hit for {func.__name__} with key {key}")
+            logger.debug("Dynamic cache hit for %s with key %s", func.__name__, key)
             
             # If build completed, move to permanent cache
             if result.status not in ['BUILDING', 'PENDING', 'UNKNOWN']:
@@ -658,11 +839,11 @@ def smart_build_cache(func):
         if result.status in ['BUILDING', 'PENDING', 'UNKNOWN']:
             # Running build - use dynamic cache
             cache_manager.dynamic_cache[key] = result
-            logger.debug(f"Cached running build in dynamic cache: {key}")
+            logger.debug("Cached running build in dynamic cache: %s", key)
         else:
             # Completed build - use permanent cache
             cache_manager.permanent_cache[key] = result
-            logger.debug(f"Cached completed build in permanent cache: {key}")
+            logger.debug("Cached completed build in permanent cache: %s", key)
         
         return result
     
@@ -683,7 +864,7 @@ def smart_pipeline_cache(func):
             # Check if all stages are completed
             if result.get('status') in ['SUCCESS', 'FAILED', 'ABORTED', 'UNSTABLE']:
                 cache_manager.stats['hits'] += 1
-                logger.debug(f"Permanent cache hit for pipeline {key}")
+                logger.debug("Permanent cache hit for pipeline %s", key)
                 return result
         except KeyError:
             pass
@@ -692,7 +873,7 @@ def smart_pipeline_cache(func):
         try:
             result = cache_manager.dynamic_cache[key]
             cache_manager.stats['hits'] += 1
-            logger.debug(f"Dynamic cache hit for pipeline {key}")
+            logger.debug("Dynamic cache hit for pipeline %s", key)
             
             # If pipeline completed, move to permanent cache
             if result.get('status') in ['SUCCESS', 'FAILED', 'ABORTED', 'UNSTABLE']:
@@ -714,11 +895,11 @@ def smart_pipeline_cache(func):
         if result.get('status') in ['SUCCESS', 'FAILED', 'ABORTED', 'UNSTABLE']:
             # Completed pipeline - use permanent cache
             cache_manager.permanent_cache[key] = result
-            logger.debug(f"Cached completed pipeline in permanent cache: {key}")
+            logger.debug("Cached completed pipeline in permanent cache: %s", key)
         else:
             # Running pipeline - use dynamic cache
             cache_manager.dynamic_cache[key] = result
-            logger.debug(f"Cached running pipeline in dynamic cache: {key}")
+            logger.debug("Cached running pipeline in dynamic cache: %s", key)
         
         return result
     
@@ -783,6 +964,68 @@ class JobTreeItem(BaseModel):
     url: Optional[str] = None
     description: Optional[str] = None
 
+@dataclass(slots=True)
+class JobTable:
+    """
+    Column-oriented job/folder listing produced by the folder crawl.
+    
+    Row i is (names[i], full_names[i], types[i], urls[i], descriptions[i]), in
+    the JobTreeItem schema. Lowercased names are computed once on insert so
+    case-insensitive searches scan plain lists of strings; rows are only turned
+    into dicts for the items a tool actually returns.
+    """
+    names: List[str] = field(default_factory=list)
+    full_names: List[str] = field(default_factory=list)
+    types: List[str] = field(default_factory=list)  # "job" or "folder"
+    urls: List[Optional[str]] = field(default_factory=list)
+    descriptions: List[Optional[str]] = field(default_factory=list)
+    names_lower: List[str] = field(default_factory=list)
+    full_names_lower: List[str] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def append(self, name: str, full_name: str, item_type: str,
+               url: Optional[str] = None, description: Optional[str] = None) -> None:
+        """Add one row."""
+        self.names.append(name)
+        self.full_names.append(full_name)
+        self.types.append(item_type)
+        self.urls.append(url)
+        self.descriptions.append(description)
+        self.names_lower.append(name.lower())
+        self.full_names_lower.append(full_name.lower())
+    
+    def append_row(self, other: "JobTable", index: int) -> None:
+        """Copy row `index` of another table, reusing its lowercased names."""
+        self.names.append(other.names[index])
+        self.full_names.append(other.full_names[index])
+        self.types.append(other.types[index])
+        self.urls.append(other.urls[index])
+        self.descriptions.append(other.descriptions[index])
+        self.names_lower.append(other.names_lower[index])
+        self.full_names_lower.append(other.full_names_lower[index])
+    
+    def extend(self, other: "JobTable") -> None:
+        """Append all rows of another table."""
+        self.names.extend(other.names)
+        self.full_names.extend(other.full_names)
+        self.types.extend(other.types)
+        self.urls.extend(other.urls)
+        self.descriptions.extend(other.descriptions)
+        self.names_lower.extend(other.names_lower)
+        self.full_names_lower.extend(other.full_names_lower)
+    
+    def row(self, index: int) -> Dict[str, Any]:
+        """Serialize row `index` to the JobTreeItem response shape."""
+        return {
+            "name": self.names[index],
+            "full_name": self.full_names[index],
+            "type": self.types[index],
+            "url": self.urls[index],
+            "description": self.descriptions[index]
+        }
+
 class FolderInfo(BaseModel):
     name: str
     full_name: str
@@ -858,110 +1101,154 @@ class BatchMonitoringResponse(BaseModel):
 def _fetch_crumb_token(context: Dict[str, Any]):
     """Fetch a new CSRF crumb token from Jenkins."""
     request_id = context.get('request_id', 'N/A')
-    logger.info(f"[{request_id}] Fetching new CSRF crumb token")
+    logger.info("[%s] Fetching new CSRF crumb token", request_id)
     
-    url = f"{JenkinsConfig.URL}/crumbIssuer/api/json"
-    auth = get_jenkins_auth()
-    response = requests.get(url, auth=auth, timeout=JenkinsConfig.DEFAULT_TIMEOUT)
+    url = f"{_JENKINS_BASE_URL}/crumbIssuer/api/json"
+    response = _SESSION.get(url, timeout=(JenkinsConfig.CONNECT_TIMEOUT, JenkinsConfig.DEFAULT_TIMEOUT))
     response.raise_for_status()
     return response
 
+def _get_cached_crumb() -> Optional[str]:
+    """Return the cached crumb token if it is still valid, otherwise None."""
+    # Read the deadline before the token (the reverse of the order they are
+    # written in), so a fresh deadline is never paired with a stale token
+    expires = _crumb_cache["expires"]
+    token = _crumb_cache["token"]
+    if token and time.monotonic() < expires - CRUMB_EXPIRY_MARGIN_SECONDS:
+        return token
+    return None
+
 def get_jenkins_crumb(context: Dict[str, Any]) -> Optional[str]:
     """Get Jenkins CSRF crumb token for POST operations."""
     request_id = context.get('request_id', 'N/A')
     
+    # Fast path: a valid cached crumb needs no locking
+    crumb_token = _get_cached_crumb()
+    if crumb_token:
+        logger.info("[%s] Using cached crumb token", request_id)
+        return crumb_token
+    
     with _crumb_cache["lock"]:
-        # Check if we have a valid cached crumb
-        if (_crumb_cache["token"] and _crumb_cache["expires"] and 
-            datetime.now() < _crumb_cache["expires"]):
-            logger.info(f"[{request_id}] Using cached crumb token")
-            return _crumb_cache["token"]
+        # Re-check under the lock in case another thread refreshed it meanwhile
+        crumb_token = _get_cached_crumb()
+        if crumb_token:
+            logger.info("[%s] Using cached crumb token", request_id)
+            return crumb_token
         
         # Fetch new crumb with retry logic
         try:
             response = _fetch_crumb_token(context)
-            crumb_data = response.json()
+            crumb_data = _json(response)
             crumb_token = crumb_data.get("crumb")
             
             if crumb_token:
-                # Cache crumb for configured minutes
+                # Cache crumb for configured minutes; store the token before its
+                # expiry so a lock-free reader sees at worst a new token with the
+                # old deadline, which misses and refreshes under the lock
                 _crumb_cache["token"] = crumb_token
-                _crumb_cache["expires"] = datetime.now() + timedelta(minutes=JenkinsConfig.CRUMB_CACHE_MINUTES)
-                logger.info(f"[{request_id}] Successfully fetched and cached new crumb token")
+                _crumb_cache["expires"] = time.monotonic() + JenkinsConfig.CRUMB_CACHE_MINUTES * 60
+                logger.info("[%s] Successfully fetched and cached new crumb token", request_id)
                 return crumb_token
             else:
-                logger.warning(f"[{request_id}] No crumb token in response")
+                logger.warning("[%s] No crumb token in response", request_id)
                 return None
                 
         except requests.exceptions.RequestException as e:
-            logger.warning(f"[{request_id}] Failed to fetch crumb token: {e}")
+            logger.warning("[%s] Failed to fetch crumb token: %s", request_id, e)
             return None
 
-# Helper to make Jenkins requests for nested job paths
+# Helper to make authenticated Jenkins requests
 @with_retry()
-def jenkins_request_nested(method, job_path, endpoint_suffix, context: Dict[str, Any], **kwargs):
-    """Make Jenkins request handling nested job paths like 'folder1/subfolder/jobname'."""
-    request_id = context.get('request_id', 'N/A')
+def jenkins_request(method, endpoint, context: Dict[str, Any], is_job_specific: bool = True,
+                    suffix: Optional[str] = None, allowed_statuses: Tuple[int, ...] = (), **kwargs):
+    """
+    Make an authenticated Jenkins API request.
     
-    # URL encode each path segment
-    path_parts = job_path.split('/')
-    encoded_parts = [quote(part, safe='') for part in path_parts]
-    encoded_path = '/job/'.join(encoded_parts)
+    Args:
+        method: HTTP method
+        endpoint: Job path like 'folder1/subfolder/jobname' when is_job_specific is True,
+                  otherwise a server-relative endpoint like 'queue/api/json'
+        context: Request context for logging
+        is_job_specific: If True, encode endpoint as a (possibly nested) job path
+        suffix: Endpoint appended after the job path (e.g. 'api/json', '42/api/json')
+        allowed_statuses: Error statuses (e.g. 404) returned to the caller instead of raised
+        **kwargs: Additional arguments passed to requests
     
-    url = f"{JenkinsConfig.URL}/job/{encoded_path}/{endpoint_suffix}"
+    Returns:
+        The successful requests.Response
+    """
+    request_id = context.get('request_id', 'N/A')
+    if is_job_specific:
+        url = f"{_JOB_URL_BASE}{_encode_job_path(endpoint)}"
+    else:
+        url = f"{_JENKINS_BASE_URL}/{endpoint}"
+    if suffix:
+        url = f"{url}/{suffix}"
     
-    auth = get_jenkins_auth()
-    headers = kwargs.get('headers', {})
+    headers = dict(kwargs.get('headers') or ())
     
     # Add CSRF crumb for POST operations
     if method.upper() in ['POST', 'PUT', 'DELETE']:
         crumb = get_jenkins_crumb(context)
         if crumb:
             headers['Jenkins-Crumb'] = crumb
-            logger.info(f"[{request_id}] Added CSRF crumb to {method} request")
+            logger.info("[%s] Added CSRF crumb to %s request", request_id, method)
     
     kwargs['headers'] = headers
+    kwargs.setdefault('timeout', _REQUEST_TIMEOUT)
     
-    logger.info(f"[{request_id}] Making nested Jenkins API request: {method} {url}")
+    logger.info("[%s] Making Jenkins API request: %s %s", request_id, method, url)
     try:
-        response = requests.request(method, url, auth=auth, **kwargs)
+        response = _SESSION.request(method, url, **kwargs)
+        if response.status_code in allowed_statuses:
+            logger.info("[%s] Jenkins API request returned expected status %s", request_id, response.status_code)
+            return response
         response.raise_for_status()
-        logger.info(f"[{request_id}] Nested Jenkins API request successful (Status: {response.status_code})")
+        logger.info("[%s] Jenkins API request successful (Status: %s)", request_id, response.status_code)
         return response
     except requests.exceptions.RequestException as e:
-        logger.error(f"[{request_id}] Nested Jenkins API request failed: {e}")
+        logger.error("[%s] Jenkins API request failed: %s", request_id, e)
         raise
 
-# Helper to make authenticated Jenkins requests
-@with_retry()
-def jenkins_request(method, endpoint, context: Dict[str, Any], is_job_specific: bool = True, **kwargs):
-    request_id = context.get('request_id', 'N/A')
-    if is_job_specific:
-        url = f"{JenkinsConfig.URL}/job/{endpoint}"
-    else:
-        url = f"{JenkinsConfig.URL}/{endpoint}"
+# Last response body and validators per endpoint for conditional GETs:
+# endpoint -> (ETag, Last-Modified, decoded JSON)
+_conditional_cache: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+
+def _get_json_conditional(endpoint: str, context: Dict[str, Any]) -> Any:
+    """
+    GET a server-relative JSON endpoint, revalidating the previous response.
     
-    auth = get_jenkins_auth()
-    headers = kwargs.get('headers', {})
+    If Jenkins sent an ETag or Last-Modified header last time, they are sent
+    back as If-None-Match / If-Modified-Since; a 304 Not Modified reply then
+    reuses the previously decoded body instead of transferring it again.
     
-    # Add CSRF crumb for POST operations
-    if method.upper() in ['POST', 'PUT', 'DELETE']:
-        crumb = get_jenkins_crumb(context)
-        if crumb:
-            headers['Jenkins-Crumb'] = crumb
-            logger.info(f"[{request_id}] Added CSRF crumb to {method} request")
-    
-    kwargs['headers'] = headers
+    Args:
+        endpoint: Server-relative endpoint like 'queue/api/json'
+        context: Request context for logging
     
-    logger.info(f"[{request_id}] Making Jenkins API request: {method} {url}")
-    try:
-        response = requests.request(method, url, auth=auth, **kwargs)
-        response.raise_for_status()
-        logger.info(f"[{request_id}] Jenkins API request successful (Status: {response.status_code})")
-        return response
-    except requests.exceptions.RequestException as e:
-        logger.error(f"[{request_id}] Jenkins API request failed: {e}")
-        raise
+    Returns:
+        The decoded JSON body
+    """
+    cached = _conditional_cache.get(endpoint)
+    headers = {}
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    
+    resp = jenkins_request("GET", endpoint, context, is_job_specific=False, headers=headers)
+    if resp.status_code == 304 and cached is not None:
+        logger.debug("[%s] %s not modified, reusing cached response", context.get('request_id', 'N/A'), endpoint)
+        return cached[2]
+    
+    data = _json(resp)
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        _conditional_cache[endpoint] = (etag, last_modified, data)
+    return data
 
 # Initialize FastMCP
 parser = argparse.ArgumentParser(description="Jenkins MCP Server", add_help=False)
@@ -976,6 +1263,10 @@ args, unknown = parser.parse_known_args()
 mcp = FastMCP("jenkins_server", port=args.port, host=args.host)
 
 # --- Context Generation ---
+# Request IDs are "<pid>-<sequence>" in hex: unique per process and cheap to generate
+_REQUEST_SEQ = itertools.count(1)
+_REQUEST_ID_PREFIX = f"{os.getpid():x}"
+
 def get_request_context() -> Dict[str, str]:
     """
     Creates a context dictionary for a single request.
@@ -983,7 +1274,7 @@ def get_request_context() -> Dict[str, str]:
     Returns:
         Dict containing a unique request ID for logging and tracing
     """
-    return {"request_id": str(uuid.uuid4())}
+    return {"request_id": f"{_REQUEST_ID_PREFIX}-{next(_REQUEST_SEQ):x}"}
 
 def create_job_not_found_error(job_name: str, operation: str) -> str:
     """
@@ -1028,46 +1319,36 @@ def trigger_job(job_name: str, params: Optional[Dict[str, Any]] = None) -> Trigg
         params: Job parameters. For multiselect parameters, pass as a list.
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request to trigger job: '{job_name}' with params: {params}")
+    logger.info("[%s] Received request to trigger job: '%s' with params: %s", context['request_id'], job_name, params)
     
     try:
-        jenkins_params = params.get('args', {}).get('params', params) if params else None
-        logger.info(f"[{context['request_id']}] Extracted Jenkins params: {jenkins_params}")
+        # Some MCP clients wrap the payload as {"args": {"params": {...}}}; unwrap it
+        if not params:
+            jenkins_params = None
+        elif 'args' in params and isinstance(params['args'], dict):
+            jenkins_params = params['args'].get('params', params)
+        else:
+            jenkins_params = params
+        logger.info("[%s] Extracted Jenkins params: %s", context['request_id'], jenkins_params)
 
         processed_params = None
         
-        # Check if this is a nested job path
-        if '/' in job_name:
-            # Handle nested job path
-            if jenkins_params:
-                processed_params = process_jenkins_parameters(jenkins_params, context)
-                headers = {"Content-Type": "application/x-www-form-urlencoded"}
-                encoded_params = urlencode(processed_params)
-                logger.info(f"[{context['request_id']}] Triggering nested job '{job_name}' with processed params: {processed_params}")
-                resp = jenkins_request_nested("POST", job_name, "buildWithParameters", context, data=encoded_params, headers=headers)
-            else:
-                logger.info(f"[{context['request_id']}] Triggering nested job '{job_name}' without parameters")
-                resp = jenkins_request_nested("POST", job_name, "build", context)
+        if jenkins_params:
+            processed_params = process_jenkins_parameters(jenkins_params, context)
+            encoded_params = urlencode(processed_params)
+            logger.info("[%s] Triggering job '%s' with processed params: %s", context['request_id'], job_name, processed_params)
+            resp = jenkins_request("POST", job_name, context, suffix="buildWithParameters", data=encoded_params, headers=_FORM_HEADERS)
         else:
-            # Handle simple job name (legacy behavior)
-            if jenkins_params:
-                processed_params = process_jenkins_parameters(jenkins_params, context)
-                build_url = f"{job_name}/buildWithParameters"
-                headers = {"Content-Type": "application/x-www-form-urlencoded"}
-                encoded_params = urlencode(processed_params)
-                logger.info(f"[{context['request_id']}] Triggering job '{job_name}' with processed params: {processed_params}")
-                resp = jenkins_request("POST", build_url, context, data=encoded_params, headers=headers)
-            else:
-                build_url = f"{job_name}/build"
-                logger.info(f"[{context['request_id']}] Triggering job '{job_name}' without parameters")
-                resp = jenkins_request("POST", build_url, context)
+            logger.info("[%s] Triggering job '%s' without parameters", context['request_id'], job_name)
+            resp = jenkins_request("POST", job_name, context, suffix="build")
 
         queue_url = resp.headers.get("Location")
-        logger.info(f"[{context['request_id']}] Job '{job_name}' triggered successfully. Queue URL: {queue_url}")
+        logger.info("[%s] Job '%s' triggered successfully. Queue URL: %s", context['request_id'], job_name, queue_url)
         
         # Invalidate relevant caches since job state has changed
         cache_manager.invalidate_job_caches(job_name)
-        logger.debug(f"[{context['request_id']}] Invalidated caches for triggered job: {job_name}")
+        _invalidate_job_tree()
+        logger.debug("[%s] Invalidated caches for triggered job: %s", context['request_id'], job_name)
         
         return TriggerJobResponse(
             job_name=job_name, 
@@ -1080,13 +1361,13 @@ def trigger_job(job_name: str, params: Optional[Dict[str, Any]] = None) -> Trigg
         if e.response.status_code == 404:
             # Job not found - provide helpful suggestions
             helpful_error = create_job_not_found_error(job_name, "triggering")
-            logger.error(f"[{context.get('request_id', 'N/A')}] {helpful_error}")
+            logger.error("[%s] %s", context.get('request_id', 'N/A'), helpful_error)
             raise ValueError(helpful_error)
         else:
-            logger.error(f"[{context.get('request_id', 'N/A')}] Failed to trigger job '{job_name}': {e}")
+            logger.error("[%s] Failed to trigger job '%s': %s", context.get('request_id', 'N/A'), job_name, e)
             raise
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to trigger job '{job_name}': {e}")
+        logger.error("[%s] Failed to trigger job '%s': %s", context.get('request_id', 'N/A'), job_name, e)
         raise
 
 @mcp.tool()
@@ -1104,44 +1385,47 @@ def get_job_info(job_name: str, auto_search: bool = True) -> Dict[str, Any]:
         JobInfoResponse with either direct job info or search results
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for job info: '{job_name}' (auto_search={auto_search})")
+    logger.info("[%s] Received request for job info: '%s' (auto_search=%s)", context['request_id'], job_name, auto_search)
     
     try:
         # Try direct lookup first
         try:
-            if '/' in job_name:
-                resp = jenkins_request_nested("GET", job_name, "api/json", context)
-            else:
-                endpoint = f"{job_name}/api/json"
-                resp = jenkins_request("GET", endpoint, context)
+            resp = jenkins_request("GET", job_name, context, suffix="api/json",
+                                   params={"tree": _JOB_INFO_TREE})
             
-            data = resp.json()
+            data = _json(resp)
             
             # Parse job parameters
-            parameters = []
-            param_prop = next((p for p in data.get("property", []) if p.get("_class") == "hudson.model.ParametersDefinitionProperty"), None)
-            if param_prop:
-                for param_def in param_prop.get("parameterDefinitions", []):
-                    parameters.append(JobParameter(
-                        name=param_def.get("name", ""),
-                        type=param_def.get("type", "unknown"),
-                        default_value=param_def.get("defaultParameterValue", {}).get("value"),
-                        description=param_def.get("description", ""),
-                        choices=param_def.get("choices")
-                    ))
+            param_prop = None
+            for prop in data.get("property") or ():
+                if prop.get("_class") == "hudson.model.ParametersDefinitionProperty":
+                    param_prop = prop
+                    break
+            param_defs = (param_prop.get("parameterDefinitions") or ()) if param_prop else ()
+            parameters = [
+                JobParameter(
+                    name=param_def.get("name", ""),
+                    type=param_def.get("type", "unknown"),
+                    default_value=(param_def.get("defaultParameterValue") or {}).get("value"),
+                    description=param_def.get("description", ""),
+                    choices=param_def.get("choices")
+                )
+                for param_def in param_defs
+            ]
             
             last_build = data.get("lastBuild")
             last_build_number = last_build.get("number") if last_build else None
+            last_build_status = last_build.get("result") if last_build else None
             
             job_info = JobInfo(
                 name=job_name,
                 description=data.get("description"),
                 parameters=parameters,
                 last_build_number=last_build_number,
-                last_build_status=None
+                last_build_status=last_build_status
             )
             
-            logger.info(f"[{context['request_id']}] Successfully retrieved direct job info for '{job_name}'. Found {len(parameters)} parameters.")
+            logger.info("[%s] Successfully retrieved direct job info for '%s'. Found %s parameters.", context['request_id'], job_name, len(parameters))
             
             return JobInfoResponse(
                 success=True,
@@ -1152,33 +1436,35 @@ def get_job_info(job_name: str, auto_search: bool = True) -> Dict[str, Any]:
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404 and auto_search:
                 # Job not found - try search fallback
-                logger.info(f"[{context['request_id']}] Direct lookup failed, attempting search fallback for '{job_name}'")
+                logger.info("[%s] Direct lookup failed, attempting search fallback for '%s'", context['request_id'], job_name)
                 
                 # Search for matching jobs
-                all_items = _collect_jobs_recursive("", context, 10)
-                jobs_only = [item for item in all_items if item.type == "job"]
+                table = _get_job_tree(context, 10)
                 
-                # Pattern matching
-                matching_jobs = []
-                for job in jobs_only:
-                    if (fnmatch.fnmatch(job.name.lower(), job_name.lower()) or 
-                        fnmatch.fnmatch(job.full_name.lower(), job_name.lower()) or
-                        job_name.lower() in job.name.lower() or
-                        job_name.lower() in job.full_name.lower()):
-                        matching_jobs.append(job)
+                # Pattern matching: compile the wildcard pattern once. A substring of
+                # the name is always a substring of the full name, so one check covers both.
+                needle = job_name.lower()
+                match = _compile_glob(needle)
+                matching_indices = [
+                    index for index, (item_type, name_lower, full_name_lower)
+                    in enumerate(zip(table.types, table.names_lower, table.full_names_lower))
+                    if item_type == "job" and (needle in full_name_lower or
+                                               match(name_lower) or
+                                               match(full_name_lower))
+                ]
                 
-                search_results = [job.model_dump() for job in matching_jobs]
+                search_results = [table.row(index) for index in matching_indices]
                 
-                if matching_jobs:
+                if matching_indices:
                     suggestions = [
-                        f"Use exact path: get_job_info('{matching_jobs[0].full_name}')",
+                        f"Use exact path: get_job_info('{table.full_names[matching_indices[0]]}')",
                         "Or try search_jobs() for more search options"
                     ]
                     
                     return JobInfoResponse(
                         success=False,
                         search_results=search_results,
-                        message=f"Job '{job_name}' not found directly, but found {len(matching_jobs)} similar jobs",
+                        message=f"Job '{job_name}' not found directly, but found {len(matching_indices)} similar jobs",
                         suggestions=suggestions
                     ).model_dump()
                 else:
@@ -1197,7 +1483,7 @@ def get_job_info(job_name: str, auto_search: bool = True) -> Dict[str, Any]:
                 raise
                 
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to get job info for '{job_name}': {e}")
+        logger.error("[%s] Failed to get job info for '%s': %s", context.get('request_id', 'N/A'), job_name, e)
         raise
 
 @mcp.tool()
@@ -1205,21 +1491,16 @@ def get_job_info(job_name: str, auto_search: bool = True) -> Dict[str, Any]:
 def get_build_status(job_name: str, build_number: int) -> BuildStatusResponse:
     """Get the status of a specific build. Supports nested job paths."""
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for build status: Job '{job_name}', Build #{build_number}")
+    logger.info("[%s] Received request for build status: Job '%s', Build #%s", context['request_id'], job_name, build_number)
     
     try:
-        # Check if this is a nested job path
-        if '/' in job_name:
-            resp = jenkins_request_nested("GET", job_name, f"{build_number}/api/json", context)
-        else:
-            endpoint = f"{job_name}/{build_number}/api/json"
-            resp = jenkins_request("GET", endpoint, context)
+        resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/api/json")
         
-        data = resp.json()
+        data = _json(resp)
         
         status = data.get("result", "BUILDING" if data.get("building") else "UNKNOWN")
         
-        logger.info(f"[{context['request_id']}] Status for '{job_name}' #{build_number} is '{status}'")
+        logger.info("[%s] Status for '%s' #%s is '%s'", context['request_id'], job_name, build_number, status)
         
         return BuildStatusResponse(
             job_name=job_name,
@@ -1233,55 +1514,109 @@ def get_build_status(job_name: str, build_number: int) -> BuildStatusResponse:
         if e.response.status_code == 404:
             # Job not found - provide helpful suggestions
             helpful_error = create_job_not_found_error(job_name, "getting build status")
-            logger.error(f"[{context.get('request_id', 'N/A')}] {helpful_error}")
+            logger.error("[%s] %s", context.get('request_id', 'N/A'), helpful_error)
             raise ValueError(helpful_error)
         else:
-            logger.error(f"[{context.get('request_id', 'N/A')}] Failed to get build status for '{job_name}' #{build_number}: {e}")
+            logger.error("[%s] Failed to get build status for '%s' #%s: %s", context.get('request_id', 'N/A'), job_name, build_number, e)
             raise
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to get build status for '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to get build status for '%s' #%s: %s", context.get('request_id', 'N/A'), job_name, build_number, e)
         raise
 
+def _read_console_log(job_name: str, build_number: int, context: Dict[str, Any],
+                      start: int = 0, max_bytes: Optional[int] = None) -> Tuple[bytes, int, bool]:
+    """
+    Read raw console log bytes from Jenkins' progressiveText endpoint.
+    
+    Args:
+        job_name: Name or path of the Jenkins job
+        build_number: Build number
+        context: Request context for logging
+        start: Byte offset to start reading from
+        max_bytes: Maximum number of bytes to read (default: no limit)
+    
+    Returns:
+        Tuple of (log bytes, total log size reported by Jenkins, Jenkins' X-More-Data flag)
+    """
+    resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/logText/progressiveText",
+                           params={"start": start}, stream=True)
+    
+    try:
+        if max_bytes is not None:
+            raw_log = resp.raw.read(max_bytes, decode_content=True)
+        else:
+            raw_log = resp.content
+    finally:
+        resp.close()
+    
+    text_size = int(resp.headers.get("X-Text-Size", 0))
+    more_data = resp.headers.get("X-More-Data", "false").lower() == "true"
+    return raw_log, text_size, more_data
+
+def _utf8_boundary(data: bytes) -> int:
+    """Return the length of `data` without an incomplete UTF-8 sequence at its end."""
+    # A multi-byte sequence is at most 4 bytes, so its lead byte is within the last 4
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte < 0x80:
+            # ASCII byte: the data ends on a complete character
+            return len(data)
+        if byte >= 0xC0:
+            # Lead byte of a sequence of 2, 3 or 4 bytes
+            length = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return len(data) - back if back < length else len(data)
+    return len(data)
+
 @mcp.tool()
-def get_console_log(job_name: str, build_number: int, start: int = 0) -> ConsoleLogResponse:
+def get_console_log(job_name: str, build_number: int, start: int = 0, max_bytes: Optional[int] = None) -> ConsoleLogResponse:
     """
     Get console log for a specific build. Supports nested job paths.
+    
+    Args:
+        job_name: Name or path of the Jenkins job
+        build_number: Build number
+        start: Byte offset to start reading from
+        max_bytes: Maximum number of log bytes to read, must be positive (default: no limit).
+            When the log is cut short, has_more is True and log_size is the offset to resume from.
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for console log: Job '{job_name}', Build #{build_number}, Start: {start}")
+    logger.info("[%s] Received request for console log: Job '%s', Build #%s, Start: %s", context['request_id'], job_name, build_number, start)
+    
+    if max_bytes is not None and max_bytes <= 0:
+        raise ValueError(f"max_bytes must be a positive number of bytes, got {max_bytes}")
     
     try:
-        # Check if this is a nested job path
-        if '/' in job_name:
-            resp = jenkins_request_nested("GET", job_name, f"{build_number}/logText/progressiveText", context, params={"start": start})
-        else:
-            endpoint = f"{job_name}/{build_number}/logText/progressiveText"
-            resp = jenkins_request("GET", endpoint, context, params={"start": start})
+        raw_log, log_size, has_more = _read_console_log(job_name, build_number, context, start, max_bytes)
         
-        has_more = resp.headers.get("X-More-Data", "false").lower() == "true"
-        log_size = int(resp.headers.get("X-Text-Size", 0))
+        if max_bytes is not None and start + len(raw_log) < log_size:
+            # Truncated by max_bytes: end the page on a character boundary and point
+            # log_size at where the next read should start
+            raw_log = raw_log[:_utf8_boundary(raw_log) or len(raw_log)]
+            has_more = True
+            log_size = start + len(raw_log)
         
-        logger.info(f"[{context['request_id']}] Fetched console log for '{job_name}' #{build_number}. Size: {len(resp.text)} bytes. More available: {has_more}")
+        logger.info("[%s] Fetched console log for '%s' #%s. Log size: %s bytes. More available: %s", context['request_id'], job_name, build_number, log_size, has_more)
         
-        return ConsoleLogResponse(log=resp.text, has_more=has_more, log_size=log_size)
+        return ConsoleLogResponse(log=raw_log.decode('utf-8', errors='replace'), has_more=has_more, log_size=log_size)
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 404:
             # Job not found - provide helpful suggestions
             helpful_error = create_job_not_found_error(job_name, "getting console log")
-            logger.error(f"[{context.get('request_id', 'N/A')}] {helpful_error}")
+            logger.error("[%s] %s", context.get('request_id', 'N/A'), helpful_error)
             raise ValueError(helpful_error)
         else:
-            logger.error(f"[{context.get('request_id', 'N/A')}] Failed to fetch console log for '{job_name}' #{build_number}: {e}")
+            logger.error("[%s] Failed to fetch console log for '%s' #%s: %s", context.get('request_id', 'N/A'), job_name, build_number, e)
             raise
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to fetch console log for '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to fetch console log for '%s' #%s: %s", context.get('request_id', 'N/A'), job_name, build_number, e)
         raise
 
 def _get_enhanced_job_info(job_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
     """Get enhanced job information for filtering purposes."""
     try:
-        resp = jenkins_request_nested("GET", job_name, "api/json", context)
-        job_data = resp.json()
+        resp = jenkins_request("GET", job_name, context, suffix="api/json",
+                               params={"tree": _ENHANCED_JOB_INFO_TREE})
+        job_data = _json(resp)
         
         # Extract key information for filtering
         enhanced_info = {
@@ -1297,17 +1632,12 @@ def _get_enhanced_job_info(job_name: str, context: Dict[str, Any]) -> Dict[str,
             "last_unstable_build": job_data.get("lastUnstableBuild"),
         }
         
-        # Get last build result if available
-        if enhanced_info["last_build"]:
-            try:
-                last_build_resp = jenkins_request_nested("GET", job_name, f"{enhanced_info['last_build']['number']}/api/json", context)
-                last_build_data = last_build_resp.json()
-                enhanced_info["last_build_result"] = last_build_data.get("result", "UNKNOWN")
-                enhanced_info["last_build_timestamp"] = last_build_data.get("timestamp", 0)
-                enhanced_info["last_build_duration"] = last_build_data.get("duration", 0)
-            except Exception:
-                enhanced_info["last_build_result"] = "UNKNOWN"
-                enhanced_info["last_build_timestamp"] = 0
+        # Last build result comes with the job data via the tree= projection
+        last_build_data = enhanced_info["last_build"]
+        if last_build_data:
+            enhanced_info["last_build_result"] = last_build_data.get("result", "UNKNOWN")
+            enhanced_info["last_build_timestamp"] = last_build_data.get("timestamp", 0)
+            enhanced_info["last_build_duration"] = last_build_data.get("duration", 0)
         else:
             enhanced_info["last_build_result"] = "NOT_BUILT"
             enhanced_info["last_build_timestamp"] = 0
@@ -1402,47 +1732,48 @@ def list_jobs(recursive: bool = True,
         List of jobs with metadata including build status and timestamps
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request to list jobs with filters: recursive={recursive}, status_filter={status_filter}, last_build_result={last_build_result}")
+    logger.info("[%s] Received request to list jobs with filters: recursive=%s, status_filter=%s, last_build_result=%s", context['request_id'], recursive, status_filter, last_build_result)
     
     try:
         if recursive:
-            # Use existing recursive collection function
-            all_items = _collect_jobs_recursive("", context, max_depth)
+            # Use the (briefly cached) recursive collection
+            table = _get_job_tree(context, max_depth)
             
             # Filter based on include_folders setting
             if include_folders:
-                result_items = all_items
+                result_indices = range(len(table))
             else:
-                result_items = [item for item in all_items if item.type == "job"]
+                result_indices = [index for index, item_type in enumerate(table.types) if item_type == "job"]
             
             # Convert to dict format for JSON serialization and apply advanced filtering
             result = []
-            for item in result_items:
-                job_dict = item.model_dump()
+            for index in result_indices:
+                job_dict = table.row(index)
                 
                 # For jobs, fetch additional details if filters are specified
-                if item.type == "job" and (status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None):
+                if job_dict["type"] == "job" and (status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None):
                     try:
-                        enhanced_job = _get_enhanced_job_info(item.full_name, context)
+                        enhanced_job = _get_enhanced_job_info(job_dict["full_name"], context)
                         job_dict.update(enhanced_job)
                         
                         # Apply filters
                         if not _job_matches_filters(job_dict, status_filter, last_build_result, days_since_last_build, enabled_only):
                             continue
                     except Exception as e:
-                        logger.debug(f"[{context['request_id']}] Could not get enhanced info for job {item.full_name}: {e}")
+                        logger.debug("[%s] Could not get enhanced info for job %s: %s", context['request_id'], job_dict['full_name'], e)
                         # If we can't get enhanced info and filters are applied, skip the job
                         if status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None:
                             continue
                 
                 result.append(job_dict)
             
-            logger.info(f"[{context['request_id']}] Found {len(result)} items after filtering (total before filtering: {len(result_items)})")
+            logger.info("[%s] Found %s items after filtering (total before filtering: %s)", context['request_id'], len(result), len(result_indices))
             
         else:
             # Top-level only with advanced filtering
-            resp = jenkins_request("GET", "api/json", context, is_job_specific=False)
-            jobs = resp.json().get("jobs", [])
+            resp = jenkins_request("GET", "api/json", context, is_job_specific=False,
+                                   params={"tree": _JOB_LIST_TREE})
+            jobs = _json(resp).get("jobs", [])
             
             result = []
             for job in jobs:
@@ -1470,82 +1801,326 @@ def list_jobs(recursive: bool = True,
                             if not _job_matches_filters(job_dict, status_filter, last_build_result, days_since_last_build, enabled_only):
                                 continue
                         except Exception as e:
-                            logger.debug(f"[{context['request_id']}] Could not get enhanced info for job {job_name}: {e}")
+                            logger.debug("[%s] Could not get enhanced info for job %s: %s", context['request_id'], job_name, e)
                             # If we can't get enhanced info and filters are applied, skip the job
                             if status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None:
                                 continue
                     
                     result.append(job_dict)
             
-            logger.info(f"[{context['request_id']}] Found {len(result)} top-level items after filtering")
+            logger.info("[%s] Found %s top-level items after filtering", context['request_id'], len(result))
         
         return result
         
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to list jobs: {e}")
+        logger.error("[%s] Failed to list jobs: %s", context.get('request_id', 'N/A'), e)
         raise
 
-def _collect_jobs_recursive(path: str, context: Dict[str, Any], max_depth: int = JenkinsConfig.DEFAULT_MAX_DEPTH, current_depth: int = 0) -> List[JobTreeItem]:
-    """Recursively collect all jobs from Jenkins folders."""
-    request_id = context.get('request_id', 'N/A')
+def _get_pool_stats() -> Dict[str, Any]:
+    """Get connection pool statistics for the shared Jenkins session."""
+    adapter = _SESSION.get_adapter(JenkinsConfig.URL)
+    # urllib3's pool container only supports lookup by key, not iteration over values
+    container = adapter.poolmanager.pools
+    pools = [container[key] for key in container.keys()]
+    return {
+        "host_pools": len(pools),
+        # The pool queue is pre-filled with None placeholders; only real entries are idle connections
+        "idle_connections": sum(conn is not None for pool in pools if pool.pool is not None for conn in list(pool.pool.queue)),
+        "connections_opened": sum(pool.num_connections for pool in pools),
+        "requests_made": sum(pool.num_requests for pool in pools),
+        "pool_maxsize": JenkinsConfig.POOL_MAXSIZE
+    }
+
+def _fetch_folder_items(path: str, context: Dict[str, Any]) -> JobTable:
+    """Fetch the direct children of a Jenkins folder (or of the root when path is empty)."""
+    if path:
+        # Folder path, encoded by jenkins_request as job/<a>/job/<b>
+        resp = jenkins_request("GET", path, context, suffix="api/json",
+                               params={"tree": _JOB_LIST_TREE})
+    else:
+        # For root level
+        resp = jenkins_request("GET", "api/json", context, is_job_specific=False,
+                               params={"tree": _JOB_LIST_TREE})
+    
+    data = _json(resp)
+    items = JobTable()
+    
+    for item in data.get("jobs", ()):
+        item_name = item.get("name", "")
+        item_class = item.get("_class", "")
+        
+        # Build full path
+        full_name = f"{path}/{item_name}" if path else item_name
+        
+        items.append(
+            item_name,
+            full_name,
+            "folder" if "folder" in item_class.lower() else "job",
+            item.get("url", ""),
+            item.get("description", "")
+        )
     
-    if current_depth >= max_depth:
-        logger.warning(f"[{request_id}] Max depth {max_depth} reached at path '{path}'")
-        return []
+    return items
+
+def _crawl_folders_parallel(path: str, context: Dict[str, Any], max_depth: int, current_depth: int) -> JobTable:
+    """
+    Collect all jobs below a folder with one request per folder.
     
-    jobs = []
+    Folders are crawled breadth-first on a thread pool so that sibling folders
+    are fetched in parallel. The result keeps the depth-first order of a
+    recursive walk: each folder is followed by its contents.
+    """
+    request_id = context.get('request_id', 'N/A')
     
-    try:
-        if path:
-            # For nested paths, use the nested request function
-            endpoint = f"api/json"
-            resp = jenkins_request_nested("GET", path, endpoint, context)
-        else:
-            # For root level
-            resp = jenkins_request("GET", "api/json", context, is_job_specific=False)
-        
-        data = resp.json()
-        items = data.get("jobs", [])
+    # Direct children of every crawled folder, keyed by folder path
+    children: Dict[str, JobTable] = {}
+    
+    # Bound concurrent folder requests; more workers than pooled connections would just queue
+    max_workers = max(1, min(JenkinsConfig.CRAWL_WORKERS, JenkinsConfig.POOL_MAXSIZE))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(_fetch_folder_items, path, context): (path, current_depth)}
         
-        for item in items:
-            item_name = item.get("name", "")
-            item_class = item.get("_class", "")
-            item_url = item.get("url", "")
-            item_description = item.get("description", "")
-            
-            # Build full path
-            full_name = f"{path}/{item_name}" if path else item_name
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
             
-            # Check if it's a folder
-            if "folder" in item_class.lower():
-                # Add folder to list
-                jobs.append(JobTreeItem(
-                    name=item_name,
-                    full_name=full_name,
-                    type="folder",
-                    url=item_url,
-                    description=item_description
-                ))
+            for future in done:
+                folder_path, depth = pending.pop(future)
+                try:
+                    items = future.result()
+                except Exception as e:
+                    logger.error("[%s] Failed to collect jobs from path '%s': %s", request_id, folder_path, e)
+                    items = JobTable()
                 
-                # Recursively collect jobs from this folder
-                logger.info(f"[{request_id}] Exploring folder: {full_name} (depth {current_depth + 1})")
-                sub_jobs = _collect_jobs_recursive(full_name, context, max_depth, current_depth + 1)
-                jobs.extend(sub_jobs)
-            else:
-                # It's a job
-                jobs.append(JobTreeItem(
-                    name=item_name,
-                    full_name=full_name,
-                    type="job",
-                    url=item_url,
-                    description=item_description
-                ))
-        
-        return jobs
+                children[folder_path] = items
+                
+                # Queue subfolders for exploration
+                for item_type, full_name in zip(items.types, items.full_names):
+                    if item_type != "folder":
+                        continue
+                    if depth + 1 >= max_depth:
+                        logger.warning("[%s] Max depth %s reached at path '%s'", request_id, max_depth, full_name)
+                        continue
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("[%s] Exploring folder: %s (depth %s)", request_id, full_name, depth + 1)
+                    pending[executor.submit(_fetch_folder_items, full_name, context)] = (full_name, depth + 1)
+    
+    # Flatten into depth-first order with an explicit stack of (folder contents, next row)
+    jobs = JobTable()
+    stack = [(children[path], 0)] if path in children else []
+    
+    while stack:
+        items, index = stack.pop()
+        if index >= len(items):
+            continue
+        stack.append((items, index + 1))
+        jobs.append_row(items, index)
+        if items.types[index] == "folder":
+            folder_items = children.get(items.full_names[index])
+            if folder_items is not None:
+                stack.append((folder_items, 0))
+    
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[%s] Connection pool stats after crawl: %s", request_id, _get_pool_stats())
+    
+    return jobs
+
+def _build_jobs_tree_query(depth: int) -> str:
+    """
+    Build a tree= query that returns `depth` levels of nested jobs in one response.
+    
+    For example, depth=2 gives
+    'jobs[name,url,description,_class,jobs[name,url,description,_class]]'.
+    """
+    fields = "name,url,description,_class"
+    return f"jobs[{fields}" + f",jobs[{fields}" * (depth - 1) + "]" * depth
+
+def _flatten_job_tree(path: str, jobs_data: List[Dict[str, Any]], context: Dict[str, Any],
+                      max_depth: int, current_depth: int, jobs: Optional[JobTable] = None) -> JobTable:
+    """
+    Flatten a nested tree= response for the folder at `path` into depth-first ordered rows.
+    
+    Rows are appended to `jobs` (a new table when omitted), which is returned.
+    """
+    request_id = context.get('request_id', 'N/A')
+    if jobs is None:
+        jobs = JobTable()
+    
+    for item in jobs_data:
+        item_name = item.get("name", "")
+        item_class = item.get("_class", "")
+        full_name = f"{path}/{item_name}" if path else item_name
+        is_folder = "folder" in item_class.lower()
+        
+        jobs.append(
+            item_name,
+            full_name,
+            "folder" if is_folder else "job",
+            item.get("url", ""),
+            item.get("description", "")
+        )
         
+        if not is_folder:
+            continue
+        if current_depth + 1 >= max_depth:
+            logger.warning("[%s] Max depth %s reached at path '%s'", request_id, max_depth, full_name)
+        elif "jobs" in item:
+            _flatten_job_tree(full_name, item["jobs"], context, max_depth, current_depth + 1, jobs)
+        else:
+            # Folder contents were not included in the batched response; crawl it directly
+            logger.info("[%s] Folder '%s' missing from batched tree, crawling it directly", request_id, full_name)
+            jobs.extend(_crawl_folders_parallel(full_name, context, max_depth, current_depth + 1))
+    
+    return jobs
+
+def _collect_jobs_recursive(path: str, context: Dict[str, Any], max_depth: int = JenkinsConfig.DEFAULT_MAX_DEPTH, current_depth: int = 0) -> JobTable:
+    """
+    Recursively collect all jobs from Jenkins folders.
+    
+    The whole subtree down to max_depth is fetched in a single request using a
+    nested tree= query. If that request fails, or a folder's children are
+    missing from the response, those folders are crawled one request per folder.
+    """
+    request_id = context.get('request_id', 'N/A')
+    
+    if current_depth >= max_depth:
+        logger.warning("[%s] Max depth %s reached at path '%s'", request_id, max_depth, path)
+        return JobTable()
+    
+    params = {"tree": _build_jobs_tree_query(max_depth - current_depth)}
+    try:
+        if path:
+            resp = jenkins_request("GET", path, context, suffix="api/json", params=params)
+        else:
+            resp = jenkins_request("GET", "api/json", context, is_job_specific=False, params=params)
+        jobs_data = _json(resp).get("jobs", [])
+    except Exception as e:
+        logger.warning("[%s] Batched tree fetch failed for path '%s', crawling folders individually: %s", request_id, path, e)
+        return _crawl_folders_parallel(path, context, max_depth, current_depth)
+    
+    return _flatten_job_tree(path, jobs_data, context, max_depth, current_depth)
+
+def _collect_folder_subtree(path: str, context: Dict[str, Any], max_depth: int, current_depth: int) -> JobTable:
+    """
+    Collect the jobs below the folder at `path` exactly as a crawl from the root would list them.
+    
+    Returns an empty table when `path` does not exist or is not a folder. A
+    multibranch project, for instance, has no "folder" in its class, so a full
+    crawl lists it as a single job and never descends into its branches.
+    """
+    request_id = context.get('request_id', 'N/A')
+    
+    if current_depth >= max_depth:
+        return JobTable()
+    
+    # Ask for the folder's own class and real name in the same request as its subtree
+    params = {"tree": "_class,fullName," + _build_jobs_tree_query(max_depth - current_depth)}
+    try:
+        resp = jenkins_request("GET", path, context, suffix="api/json", params=params,
+                               allowed_statuses=(404,))
     except Exception as e:
-        logger.error(f"[{request_id}] Failed to collect jobs from path '{path}': {e}")
-        return []
+        logger.warning("[%s] Could not fetch folder '%s' directly: %s", request_id, path, e)
+        return JobTable()
+    
+    if resp.status_code == 404:
+        logger.info("[%s] No item at '%s'", request_id, path)
+        return JobTable()
+    
+    data = _json(resp)
+    if "folder" not in data.get("_class", "").lower():
+        logger.info("[%s] '%s' is not a folder", request_id, path)
+        return JobTable()
+    
+    # Jenkins resolves item names case-insensitively, so build full names from the
+    # folder's real name rather than from the (possibly differently cased) path asked for
+    return _flatten_job_tree(data.get("fullName") or path, data.get("jobs", []), context, max_depth, current_depth)
+
+def _get_cached_tree(key: Tuple[str, int]) -> Optional[JobTable]:
+    """Return the cached job tree for (root, max_depth) if it is still valid, otherwise None."""
+    entry = _tree_cache["entries"].get(key)
+    if entry is not None:
+        expires, version, table = entry
+        if version == _tree_cache["version"] and time.monotonic() < expires:
+            return table
+    return None
+
+def _get_job_tree(context: Dict[str, Any], max_depth: int, root: str = "") -> JobTable:
+    """
+    Return every job and folder under `root` (the Jenkins root by default), reusing a recent crawl.
+    
+    Crawl results are cached per (root, max_depth) for JenkinsConfig.TREE_CACHE_TTL
+    seconds so that a burst of lookups walks the folder hierarchy only once.
+    Concurrent callers asking for a tree that is already being crawled wait for
+    that crawl instead of starting their own; crawls of different trees run in
+    parallel. A `root` that is not a folder yields an empty table.
+    """
+    request_id = context.get('request_id', 'N/A')
+    key = (root, max_depth)
+    
+    # Fast path: a valid cached tree needs no locking
+    table = _get_cached_tree(key)
+    if table is not None:
+        logger.debug("[%s] Using cached job tree for '%s' (%s items)", request_id, root, len(table))
+        return table
+    
+    with _tree_cache["lock"]:
+        # Re-check under the lock in case another thread finished a crawl meanwhile
+        table = _get_cached_tree(key)
+        if table is not None:
+            logger.debug("[%s] Using cached job tree for '%s' (%s items)", request_id, root, len(table))
+            return table
+        
+        inflight = _tree_cache["inflight"]
+        future = inflight.get(key)
+        if future is None:
+            future = Future()
+            inflight[key] = future
+            version = _tree_cache["version"]
+            is_leader = True
+        else:
+            is_leader = False
+    
+    if not is_leader:
+        logger.debug("[%s] Waiting for in-flight crawl of job tree '%s'", request_id, root)
+        return future.result()
+    
+    try:
+        if root:
+            # Items directly under `root` sit at the same depth as in a full crawl
+            table = _collect_folder_subtree(root, context, max_depth, root.count('/') + 1)
+        else:
+            table = _collect_jobs_recursive(root, context, max_depth)
+    except BaseException as e:
+        with _tree_cache["lock"]:
+            if inflight.get(key) is future:
+                del inflight[key]
+        future.set_exception(e)
+        raise
+    
+    with _tree_cache["lock"]:
+        # A crawl that started before an invalidation must not replace a newer entry
+        if version == _tree_cache["version"]:
+            entries = _tree_cache["entries"]
+            now = time.monotonic()
+            # Drop expired trees (e.g. from earlier scoped searches) while storing this one;
+            # snapshot the items since _invalidate_job_tree clears without the lock
+            for entry_key, (expires, _, _) in list(entries.items()):
+                if expires <= now:
+                    entries.pop(entry_key, None)
+            entries[key] = (now + JenkinsConfig.TREE_CACHE_TTL, version, table)
+        if inflight.get(key) is future:
+            del inflight[key]
+    future.set_result(table)
+    return table
+
+def _invalidate_job_tree() -> None:
+    """Drop all cached job trees so the next lookup crawls Jenkins again."""
+    # No lock: this must not wait behind a crawl in progress. A crawl that
+    # started before the bump stores its result under the old version, which
+    # readers then ignore.
+    _tree_cache["version"] = next(_tree_cache_versions)
+    _tree_cache["entries"].clear()
+    # Later callers start a fresh crawl rather than joining one that began before the change
+    _tree_cache["inflight"].clear()
 
 
 @mcp.tool()
@@ -1557,51 +2132,46 @@ def get_folder_info(folder_path: str) -> Dict[str, Any]:
         folder_path: Path to the folder (e.g., 'folder1/subfolder')
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for folder info: '{folder_path}'")
+    logger.info("[%s] Received request for folder info: '%s'", context['request_id'], folder_path)
     
     try:
-        endpoint = "api/json"
-        resp = jenkins_request_nested("GET", folder_path, endpoint, context)
-        data = resp.json()
+        resp = jenkins_request("GET", folder_path, context, suffix="api/json",
+                               params={"tree": _FOLDER_INFO_TREE})
+        data = _json(resp)
         
-        # Separate jobs and folders
+        # Separate jobs and folders, building the FolderInfo/JobTreeItem response
+        # shape directly as dicts rather than validating and re-dumping models
         jobs = []
         folders = []
         
-        for item in data.get("jobs", []):
+        for item in data.get("jobs", ()):
             item_name = item.get("name", "")
-            item_class = item.get("_class", "")
-            item_url = item.get("url", "")
-            item_description = item.get("description", "")
+            is_folder = "folder" in item.get("_class", "").lower()
             
-            full_name = f"{folder_path}/{item_name}"
-            
-            tree_item = JobTreeItem(
-                name=item_name,
-                full_name=full_name,
-                type="folder" if "folder" in item_class.lower() else "job",
-                url=item_url,
-                description=item_description
-            )
+            tree_item = {
+                "name": item_name,
+                "full_name": f"{folder_path}/{item_name}",
+                "type": "folder" if is_folder else "job",
+                "url": item.get("url", ""),
+                "description": item.get("description", "")
+            }
             
-            if "folder" in item_class.lower():
+            if is_folder:
                 folders.append(tree_item)
             else:
                 jobs.append(tree_item)
         
-        folder_info = FolderInfo(
-            name=folder_path.split('/')[-1],
-            full_name=folder_path,
-            description=data.get("description", ""),
-            jobs=jobs,
-            folders=folders
-        )
-        
-        logger.info(f"[{context['request_id']}] Folder '{folder_path}' contains {len(jobs)} jobs and {len(folders)} folders")
-        return folder_info.model_dump()
+        logger.info("[%s] Folder '%s' contains %s jobs and %s folders", context['request_id'], folder_path, len(jobs), len(folders))
+        return {
+            "name": folder_path.split('/')[-1],
+            "full_name": folder_path,
+            "description": data.get("description", ""),
+            "jobs": jobs,
+            "folders": folders
+        }
         
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to get folder info for '{folder_path}': {e}")
+        logger.error("[%s] Failed to get folder info for '%s': %s", context.get('request_id', 'N/A'), folder_path, e)
         raise
 
 @mcp.tool()
@@ -1630,71 +2200,81 @@ def search_jobs(pattern: str,
         List of matching items with their full paths and enhanced metadata
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Searching for items with pattern: '{pattern}' (type: {job_type}, regex: {use_regex})")
+    logger.info("[%s] Searching for items with pattern: '%s' (type: %s, regex: %s)", context['request_id'], pattern, job_type, use_regex)
     
     try:
-        # Get all items using existing recursive function
-        all_items = _collect_jobs_recursive("", context, max_depth)
+        # Get all items using the (briefly cached) recursive collection. A wildcard
+        # pattern with a literal folder prefix only needs that folder's subtree;
+        # fall back to the full tree if the scoped crawl finds nothing (e.g. the
+        # prefix does not exist or is not a folder).
+        scope = "" if use_regex else _glob_folder_prefix(pattern)
+        table = _get_job_tree(context, max_depth, scope) if scope else None
+        if not table:
+            table = _get_job_tree(context, max_depth)
         
         # Filter by type
         if job_type == "job":
-            filtered_items = [item for item in all_items if item.type == "job"]
+            filtered_indices = [index for index, item_type in enumerate(table.types) if item_type == "job"]
         elif job_type == "folder":
-            filtered_items = [item for item in all_items if item.type == "folder"]
+            filtered_indices = [index for index, item_type in enumerate(table.types) if item_type == "folder"]
         else:  # "all"
-            filtered_items = all_items
+            filtered_indices = range(len(table))
+        
+        # Compile the pattern once up front rather than per item
+        regex_search = None
+        if use_regex:
+            try:
+                regex_search = re.compile(pattern, re.IGNORECASE).search
+            except re.error as regex_error:
+                logger.warning("[%s] Invalid regex pattern '%s': %s", context['request_id'], pattern, regex_error)
+                # Fall back to wildcard matching below
+        glob_match = _compile_glob(pattern) if regex_search is None else None
         
         # Apply pattern matching
-        matching_items = []
-        for item in filtered_items:
-            pattern_matches = False
-            
-            if use_regex:
-                try:
-                    # Use regex pattern matching
-                    regex_pattern = re.compile(pattern, re.IGNORECASE)
-                    pattern_matches = (regex_pattern.search(item.name) is not None or 
-                                     regex_pattern.search(item.full_name) is not None)
-                except re.error as regex_error:
-                    logger.warning(f"[{context['request_id']}] Invalid regex pattern '{pattern}': {regex_error}")
-                    # Fall back to fnmatch
-                    pattern_matches = (fnmatch.fnmatch(item.name.lower(), pattern.lower()) or 
-                                     fnmatch.fnmatch(item.full_name.lower(), pattern.lower()))
-            else:
-                # Use wildcard pattern matching
-                pattern_matches = (fnmatch.fnmatch(item.name.lower(), pattern.lower()) or 
-                                 fnmatch.fnmatch(item.full_name.lower(), pattern.lower()))
-            
-            if pattern_matches:
-                matching_items.append(item)
+        if regex_search is not None:
+            # Use regex pattern matching (case-insensitive via re.IGNORECASE)
+            names = table.names
+            full_names = table.full_names
+            matching_indices = [
+                index for index in filtered_indices
+                if regex_search(names[index]) is not None or regex_search(full_names[index]) is not None
+            ]
+        else:
+            # Use wildcard pattern matching against the precomputed lowercase names
+            names_lower = table.names_lower
+            full_names_lower = table.full_names_lower
+            matching_indices = [
+                index for index in filtered_indices
+                if glob_match(names_lower[index]) or glob_match(full_names_lower[index])
+            ]
         
         # Apply advanced filtering to jobs and convert to dict format
         result = []
-        for item in matching_items:
-            job_dict = item.model_dump()
+        for index in matching_indices:
+            job_dict = table.row(index)
             
             # For jobs, apply advanced filtering if specified
-            if item.type == "job" and (status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None):
+            if job_dict["type"] == "job" and (status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None):
                 try:
-                    enhanced_job = _get_enhanced_job_info(item.full_name, context)
+                    enhanced_job = _get_enhanced_job_info(job_dict["full_name"], context)
                     job_dict.update(enhanced_job)
                     
                     # Apply filters
                     if not _job_matches_filters(job_dict, status_filter, last_build_result, days_since_last_build, enabled_only):
                         continue
                 except Exception as e:
-                    logger.debug(f"[{context['request_id']}] Could not get enhanced info for job {item.full_name}: {e}")
+                    logger.debug("[%s] Could not get enhanced info for job %s: %s", context['request_id'], job_dict['full_name'], e)
                     # If we can't get enhanced info and filters are applied, skip the job
                     if status_filter or last_build_result or days_since_last_build is not None or enabled_only is not None:
                         continue
             
             result.append(job_dict)
         
-        logger.info(f"[{context['request_id']}] Found {len(result)} items matching pattern '{pattern}' after filtering")
+        logger.info("[%s] Found %s items matching pattern '%s' after filtering", context['request_id'], len(result), pattern)
         return result
         
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to search for items with pattern '{pattern}': {e}")
+        logger.error("[%s] Failed to search for items with pattern '%s': %s", context.get('request_id', 'N/A'), pattern, e)
         raise
 
 @mcp.tool()
@@ -1711,9 +2291,14 @@ def search_and_trigger(pattern: str, params: Optional[Dict[str, Any]] = None, ma
         Either trigger result or error with suggestions
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Search and trigger with pattern: '{pattern}'")
+    logger.info("[%s] Search and trigger with pattern: '%s'", context['request_id'], pattern)
     
     try:
+        # Fetch the CSRF crumb in the background while the search runs, so that a
+        # unique match can be triggered without waiting on another round-trip
+        if _get_cached_crumb() is None:
+            _IO_POOL.submit(get_jenkins_crumb, context)
+        
         # Find matching jobs
         matches = search_jobs(pattern, "job", max_depth)
         
@@ -1726,7 +2311,7 @@ def search_and_trigger(pattern: str, params: Optional[Dict[str, Any]] = None, ma
         elif len(matches) == 1:
             # Exactly one match - trigger it
             job_path = matches[0]["full_name"]
-            logger.info(f"[{context['request_id']}] Found unique match: '{job_path}', triggering job")
+            logger.info("[%s] Found unique match: '%s', triggering job", context['request_id'], job_path)
             trigger_result = trigger_job(job_path, params)
             return {
                 "success": True,
@@ -1743,7 +2328,7 @@ def search_and_trigger(pattern: str, params: Optional[Dict[str, Any]] = None, ma
             }
             
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed search and trigger with pattern '{pattern}': {e}")
+        logger.error("[%s] Failed search and trigger with pattern '%s': %s", context.get('request_id', 'N/A'), pattern, e)
         raise
 
 @mcp.tool()
@@ -1751,14 +2336,13 @@ def search_and_trigger(pattern: str, params: Optional[Dict[str, Any]] = None, ma
 def get_queue_info() -> List[Dict[str, Any]]:
     """Get information about queued builds."""
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for queue info.")
+    logger.info("[%s] Received request for queue info.", context['request_id'])
     try:
-        resp = jenkins_request("GET", "queue/api/json", context, is_job_specific=False)
-        queue_data = resp.json().get("items", [])
-        logger.info(f"[{context['request_id']}] Found {len(queue_data)} items in the queue.")
+        queue_data = _get_json_conditional("queue/api/json", context).get("items", [])
+        logger.info("[%s] Found %s items in the queue.", context['request_id'], len(queue_data))
         return queue_data
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to get queue info: {e}")
+        logger.error("[%s] Failed to get queue info: %s", context.get('request_id', 'N/A'), e)
         raise
 
 @mcp.tool()
@@ -1766,18 +2350,17 @@ def get_queue_info() -> List[Dict[str, Any]]:
 def server_info() -> Dict[str, Any]:
     """Get Jenkins server information."""
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for server info.")
+    logger.info("[%s] Received request for server info.", context['request_id'])
     try:
-        resp = jenkins_request("GET", "api/json", context, is_job_specific=False)
-        data = resp.json()
+        data = _get_json_conditional("api/json", context)
         info = {
             "version": data.get("jenkinsVersion"),
             "url": JenkinsConfig.URL
         }
-        logger.info(f"[{context['request_id']}] Jenkins version: {info['version']}")
+        logger.info("[%s] Jenkins version: %s", context['request_id'], info['version'])
         return info
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to fetch Jenkins info: {e}")
+        logger.error("[%s] Failed to fetch Jenkins info: %s", context.get('request_id', 'N/A'), e)
         raise
 
 @mcp.tool()
@@ -1787,15 +2370,29 @@ def summarize_build_log(job_name: str, build_number: int) -> dict:
     (Note: This is a demonstration tool and does not execute a real LLM call.)
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request to summarize log for '{job_name}' #{build_number}")
+    logger.info("[%s] Received request to summarize log for '%s' #%s", context['request_id'], job_name, build_number)
     try:
-        log_response = get_console_log(job_name, build_number)
-        prompt_template = LLM_RESOURCES["prompts"]["summarize_log"]
-        prompt = prompt_template.format(log_text=log_response.log)
+        # Only the start (setup, parameters) and the end (failure, result) of a log
+        # matter for a summary; fetch those two windows instead of the whole log
+        head, log_size, _ = _read_console_log(job_name, build_number, context, 0, SUMMARY_LOG_HEAD_BYTES)
+        tail_start = max(len(head), log_size - SUMMARY_LOG_TAIL_BYTES)
+        tail = b""
+        if tail_start < log_size:
+            tail, _, _ = _read_console_log(job_name, build_number, context, tail_start, SUMMARY_LOG_TAIL_BYTES)
+        
+        if tail_start > len(head):
+            omitted = tail_start - len(head)
+            log_text = (f"{head.decode('utf-8', errors='replace')}\n"
+                        f"... [{omitted} bytes omitted] ...\n"
+                        f"{tail.decode('utf-8', errors='replace')}")
+        else:
+            log_text = (head + tail).decode('utf-8', errors='replace')
+        
+        prompt = _SUMMARIZE_LOG_TEMPLATE.substitute(log_text=log_text)
         sampling_config = LLM_RESOURCES["sampling_config"]
         
         placeholder_summary = f"LLM summary for '{job_name}' build #{build_number} would be generated here."
-        logger.info(f"[{context['request_id']}] Successfully constructed prompt for summarization.")
+        logger.info("[%s] Successfully constructed prompt for summarization.", context['request_id'])
         
         response_data = SummarizeBuildLogResponse(
             summary=placeholder_summary,
@@ -1806,7 +2403,7 @@ def summarize_build_log(job_name: str, build_number: int) -> dict:
         return {"result": response_data.model_dump()}
 
     except Exception as e:
-        logger.error(f"[{context.get('request_id', 'N/A')}] Failed to summarize build log for '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to summarize build log for '%s' #%s: %s", context.get('request_id', 'N/A'), job_name, build_number, e)
         raise
 
 @mcp.tool()
@@ -1823,27 +2420,27 @@ def get_pipeline_status(job_name: str, build_number: int) -> Dict[str, Any]:
     Supports both Declarative and Scripted Pipelines.
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request for pipeline status: '{job_name}' #{build_number}")
+    logger.info("[%s] Received request for pipeline status: '%s' #%s", context['request_id'], job_name, build_number)
     
     try:
         # First, verify the build exists and is a pipeline job
-        build_info_resp = jenkins_request_nested("GET", job_name, f"{build_number}/api/json", context)
-        build_info = build_info_resp.json()
+        build_info_resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/api/json")
+        build_info = _json(build_info_resp)
         
         # Check if this is a pipeline job
         if build_info.get("_class") not in [
             "org.jenkinsci.plugins.workflow.job.WorkflowRun",
             "org.jenkinsci.plugins.pipeline.StageView$StageViewAction"
         ]:
-            logger.warning(f"[{context['request_id']}] Job '{job_name}' build #{build_number} is not a pipeline job")
+            logger.warning("[%s] Job '%s' build #%s is not a pipeline job", context['request_id'], job_name, build_number)
             return {
                 "error": f"Job '{job_name}' build #{build_number} is not a pipeline job",
                 "suggestion": "Pipeline status is only available for Jenkins Pipeline jobs (Declarative/Scripted pipelines)"
             }
         
         # Get pipeline stages using wfapi
-        stages_resp = jenkins_request_nested("GET", job_name, f"{build_number}/wfapi/describe", context)
-        stages_data = stages_resp.json()
+        stages_resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/wfapi/describe")
+        stages_data = _json(stages_resp)
         
         # Parse stage information
         stages = []
@@ -1859,11 +2456,11 @@ def get_pipeline_status(job_name: str, build_number: int) -> Dict[str, Any]:
             # Try to get stage logs if available
             try:
                 if stage.id:
-                    log_resp = jenkins_request_nested("GET", job_name, f"{build_number}/execution/node/{stage.id}/wfapi/log", context)
+                    log_resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/execution/node/{stage.id}/wfapi/log")
                     if log_resp.status_code == 200:
                         stage.logs = log_resp.text[:JenkinsConfig.MAX_LOG_SIZE]  # Limit log size
             except Exception as log_e:
-                logger.debug(f"[{context['request_id']}] Could not fetch logs for stage {stage.name}: {log_e}")
+                logger.debug("[%s] Could not fetch logs for stage %s: %s", context['request_id'], stage.name, log_e)
                 # Continue without logs - this is optional
             
             stages.append(stage)
@@ -1878,7 +2475,7 @@ def get_pipeline_status(job_name: str, build_number: int) -> Dict[str, Any]:
             estimated_duration=build_info.get("estimatedDuration")
         )
         
-        logger.info(f"[{context['request_id']}] Successfully retrieved pipeline status for '{job_name}' #{build_number} with {len(stages)} stages")
+        logger.info("[%s] Successfully retrieved pipeline status for '%s' #%s with %s stages", context['request_id'], job_name, build_number, len(stages))
         return {"result": pipeline_status.model_dump()}
         
     except requests.exceptions.HTTPError as e:
@@ -1889,7 +2486,7 @@ def get_pipeline_status(job_name: str, build_number: int) -> Dict[str, Any]:
             error_msg = f"HTTP error accessing pipeline status: {e.response.status_code}"
             suggestion = "Check Jenkins server connectivity and permissions. Pipeline API requires appropriate Jenkins permissions."
         
-        logger.error(f"[{context['request_id']}] {error_msg}")
+        logger.error("[%s] %s", context['request_id'], error_msg)
         return {
             "error": error_msg,
             "suggestion": suggestion,
@@ -1897,7 +2494,7 @@ def get_pipeline_status(job_name: str, build_number: int) -> Dict[str, Any]:
         }
     
     except Exception as e:
-        logger.error(f"[{context['request_id']}] Failed to get pipeline status for '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to get pipeline status for '%s' #%s: %s", context['request_id'], job_name, build_number, e)
         return {
             "error": f"Failed to retrieve pipeline status: {str(e)}",
             "suggestion": "Ensure the job is a Jenkins Pipeline job and the build exists. Check server connectivity and authentication."
@@ -1917,18 +2514,18 @@ def list_build_artifacts(job_name: str, build_number: int) -> Dict[str, Any]:
         Information about all artifacts including filenames, sizes, and download URLs
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request to list artifacts for '{job_name}' #{build_number}")
+    logger.info("[%s] Received request to list artifacts for '%s' #%s", context['request_id'], job_name, build_number)
     
     try:
         # Get build information including artifacts
-        build_resp = jenkins_request_nested("GET", job_name, f"{build_number}/api/json", context)
-        build_data = build_resp.json()
+        build_resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/api/json")
+        build_data = _json(build_resp)
         
         # Extract artifact information
         jenkins_artifacts = build_data.get("artifacts", [])
         
         if not jenkins_artifacts:
-            logger.info(f"[{context['request_id']}] No artifacts found for '{job_name}' #{build_number}")
+            logger.info("[%s] No artifacts found for '%s' #%s", context['request_id'], job_name, build_number)
             return {
                 "result": ArtifactListResponse(
                     job_name=job_name,
@@ -1959,7 +2556,7 @@ def list_build_artifacts(job_name: str, build_number: int) -> Dict[str, Any]:
                     file_size = artifact_data["size"]
                 else:
                     # Try to get size via HEAD request
-                    head_resp = jenkins_request_nested("HEAD", job_name, f"{build_number}/artifact/{relative_path}", context)
+                    head_resp = jenkins_request("HEAD", job_name, context, suffix=f"{build_number}/artifact/{relative_path}")
                     if "content-length" in head_resp.headers:
                         file_size = int(head_resp.headers["content-length"])
             except Exception:
@@ -1988,7 +2585,7 @@ def list_build_artifacts(job_name: str, build_number: int) -> Dict[str, Any]:
             total_size=total_size if total_size > 0 else None
         )
         
-        logger.info(f"[{context['request_id']}] Found {len(artifacts)} artifacts for '{job_name}' #{build_number}")
+        logger.info("[%s] Found %s artifacts for '%s' #%s", context['request_id'], len(artifacts), job_name, build_number)
         return {"result": artifact_response.model_dump()}
         
     except requests.exceptions.HTTPError as e:
@@ -1999,14 +2596,14 @@ def list_build_artifacts(job_name: str, build_number: int) -> Dict[str, Any]:
             error_msg = f"HTTP error accessing build artifacts: {e.response.status_code}"
             suggestion = "Check Jenkins server connectivity and permissions."
         
-        logger.error(f"[{context['request_id']}] {error_msg}")
+        logger.error("[%s] %s", context['request_id'], error_msg)
         return {
             "error": error_msg,
             "suggestion": suggestion
         }
     
     except Exception as e:
-        logger.error(f"[{context['request_id']}] Failed to list artifacts for '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to list artifacts for '%s' #%s: %s", context['request_id'], job_name, build_number, e)
         return {
             "error": f"Failed to list build artifacts: {str(e)}",
             "suggestion": "Ensure the build exists and has completed. Check server connectivity and authentication."
@@ -2027,7 +2624,7 @@ def download_build_artifact(job_name: str, build_number: int, artifact_path: str
         Artifact content (for text files) or download information
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Received request to download artifact '{artifact_path}' from '{job_name}' #{build_number}")
+    logger.info("[%s] Received request to download artifact '%s' from '%s' #%s", context['request_id'], artifact_path, job_name, build_number)
     
     max_size_bytes = max_size_mb * 1024 * 1024
     
@@ -2061,7 +2658,7 @@ def download_build_artifact(job_name: str, build_number: int, artifact_path: str
             }
         
         # Download the artifact
-        artifact_resp = jenkins_request_nested("GET", job_name, f"{build_number}/artifact/{target_artifact['relative_path']}", context)
+        artifact_resp = jenkins_request("GET", job_name, context, suffix=f"{build_number}/artifact/{target_artifact['relative_path']}")
         
         # Check response size
         content_length = artifact_resp.headers.get('content-length')
@@ -2115,14 +2712,14 @@ def download_build_artifact(job_name: str, build_number: int, artifact_path: str
             error_msg = f"HTTP error downloading artifact: {e.response.status_code}"
             suggestion = "Check Jenkins server connectivity and permissions."
         
-        logger.error(f"[{context['request_id']}] {error_msg}")
+        logger.error("[%s] %s", context['request_id'], error_msg)
         return {
             "error": error_msg,
             "suggestion": suggestion
         }
     
     except Exception as e:
-        logger.error(f"[{context['request_id']}] Failed to download artifact '{artifact_path}' from '{job_name}' #{build_number}: {e}")
+        logger.error("[%s] Failed to download artifact '%s' from '%s' #%s: %s", context['request_id'], artifact_path, job_name, build_number, e)
         return {
             "error": f"Failed to download artifact: {str(e)}",
             "suggestion": "Ensure the build and artifact exist. Check server connectivity and authentication."
@@ -2143,16 +2740,13 @@ def search_build_artifacts(job_name: str, pattern: str, max_builds: int = Jenkin
         List of matching artifacts across builds with their metadata
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Searching for artifacts matching pattern '{pattern}' in job '{job_name}'")
+    logger.info("[%s] Searching for artifacts matching pattern '%s' in job '%s'", context['request_id'], pattern, job_name)
     
     try:
-        # Get job information to find recent builds
-        job_info_resp = get_job_info(job_name, auto_search=False)
-        if "error" in job_info_resp:
-            return job_info_resp
-        
-        job_data = job_info_resp["result"]
-        builds = job_data.get("builds", [])[:max_builds]
+        # Fetch only the fields used below for the most recent max_builds builds
+        job_resp = jenkins_request("GET", job_name, context, suffix="api/json",
+                                   params={"tree": f"builds[number,result,timestamp]{{0,{max(max_builds, 0)}}}"})
+        builds = _json(job_resp).get("builds", [])[:max_builds]
         
         if not builds:
             return {
@@ -2165,6 +2759,15 @@ def search_build_artifacts(job_name: str, pattern: str, max_builds: int = Jenkin
                 }
             }
         
+        # Compile the pattern once for all builds; an invalid regex falls back to wildcards
+        regex_search = None
+        if use_regex:
+            try:
+                regex_search = re.compile(pattern, re.IGNORECASE).search
+            except re.error:
+                pass
+        glob_match = _compile_glob(pattern) if regex_search is None else None
+        
         matching_artifacts = []
         builds_searched = 0
         
@@ -2179,27 +2782,21 @@ def search_build_artifacts(job_name: str, pattern: str, max_builds: int = Jenkin
                 # Get artifacts for this build
                 artifacts_resp = list_build_artifacts(job_name, build_number)
                 if "error" in artifacts_resp:
-                    logger.debug(f"[{context['request_id']}] Could not get artifacts for build #{build_number}: {artifacts_resp['error']}")
+                    logger.debug("[%s] Could not get artifacts for build #%s: %s", context['request_id'], build_number, artifacts_resp['error'])
                     continue
                 
                 build_artifacts = artifacts_resp["result"]["artifacts"]
                 
                 # Apply pattern matching
                 for artifact in build_artifacts:
-                    artifact_matches = False
+                    filename = artifact["filename"]
+                    relative_path = artifact["relative_path"]
                     
-                    if use_regex:
-                        try:
-                            regex_pattern = re.compile(pattern, re.IGNORECASE)
-                            artifact_matches = (regex_pattern.search(artifact["filename"]) is not None or 
-                                              regex_pattern.search(artifact["relative_path"]) is not None)
-                        except re.error:
-                            # Fall back to wildcard matching
-                            artifact_matches = (fnmatch.fnmatch(artifact["filename"].lower(), pattern.lower()) or 
-                                              fnmatch.fnmatch(artifact["relative_path"].lower(), pattern.lower()))
+                    if regex_search is not None:
+                        artifact_matches = (regex_search(filename) is not None or 
+                                            regex_search(relative_path) is not None)
                     else:
-                        artifact_matches = (fnmatch.fnmatch(artifact["filename"].lower(), pattern.lower()) or 
-                                          fnmatch.fnmatch(artifact["relative_path"].lower(), pattern.lower()))
+                        artifact_matches = glob_match(filename.lower()) or glob_match(relative_path.lower())
                     
                     if artifact_matches:
                         # Add build information to artifact
@@ -2210,7 +2807,7 @@ def search_build_artifacts(job_name: str, pattern: str, max_builds: int = Jenkin
                         matching_artifacts.append(enhanced_artifact)
                         
             except Exception as e:
-                logger.debug(f"[{context['request_id']}] Error searching build #{build_number}: {e}")
+                logger.debug("[%s] Error searching build #%s: %s", context['request_id'], build_number, e)
                 continue
         
         result = {
@@ -2222,11 +2819,11 @@ def search_build_artifacts(job_name: str, pattern: str, max_builds: int = Jenkin
             "total_matches": len(matching_artifacts)
         }
         
-        logger.info(f"[{context['request_id']}] Found {len(matching_artifacts)} matching artifacts across {builds_searched} builds")
+        logger.info("[%s] Found %s matching artifacts across %s builds", context['request_id'], len(matching_artifacts), builds_searched)
         return {"result": result}
         
     except Exception as e:
-        logger.error(f"[{context['request_id']}] Failed to search artifacts in '{job_name}' with pattern '{pattern}': {e}")
+        logger.error("[%s] Failed to search artifacts in '%s' with pattern '%s': %s", context['request_id'], job_name, pattern, e)
         return {
             "error": f"Failed to search build artifacts: {str(e)}",
             "suggestion": "Ensure the job exists and has builds with artifacts. Check server connectivity and authentication."
@@ -2262,7 +2859,7 @@ def batch_trigger_jobs(operations: List[Dict[str, Any]],
     operation_id = str(uuid.uuid4())[:8]  # Short ID for monitoring
     start_time = time.time()
     
-    logger.info(f"[{context['request_id']}] Starting batch operation {operation_id} with {len(operations)} jobs")
+    logger.info("[%s] Starting batch operation %s with %s jobs", context['request_id'], operation_id, len(operations))
     
     try:
         # Validate and parse operations
@@ -2344,13 +2941,13 @@ def batch_trigger_jobs(operations: List[Dict[str, Any]],
                     
                     if result.success:
                         successful += 1
-                        logger.debug(f"[{context['request_id']}] Job '{result.job_name}' triggered successfully")
+                        logger.debug("[%s] Job '%s' triggered successfully", context['request_id'], result.job_name)
                     else:
                         failed += 1
-                        logger.warning(f"[{context['request_id']}] Job '{result.job_name}' failed: {result.error}")
+                        logger.warning("[%s] Job '%s' failed: %s", context['request_id'], result.job_name, result.error)
                         
                         if fail_fast:
-                            logger.info(f"[{context['request_id']}] Stopping batch operation due to fail_fast=True")
+                            logger.info("[%s] Stopping batch operation due to fail_fast=True", context['request_id'])
                             # Cancel remaining futures
                             for remaining_future in future_to_op:
                                 if not remaining_future.done():
@@ -2360,7 +2957,7 @@ def batch_trigger_jobs(operations: List[Dict[str, Any]],
                             
                 except Exception as e:
                     failed += 1
-                    logger.error(f"[{context['request_id']}] Unexpected error processing job '{batch_op.job_name}': {e}")
+                    logger.error("[%s] Unexpected error processing job '%s': %s", context['request_id'], batch_op.job_name, e)
                     results.append(BatchJobResult(
                         job_name=batch_op.job_name,
                         success=False,
@@ -2384,18 +2981,21 @@ def batch_trigger_jobs(operations: List[Dict[str, Any]],
             completed_at=completed_at
         )
         
+        # Serialize once; the same dict is stored for monitoring and returned
+        batch_result = batch_response.model_dump()
+        
         # Store operation for monitoring (optional)
         with _batch_lock:
             _batch_operations[operation_id] = {
-                "response": batch_response.model_dump(),
+                "response": batch_result,
                 "status": "completed",
                 "created_at": completed_at
             }
         
-        logger.info(f"[{context['request_id']}] Batch operation {operation_id} completed: "
-                   f"{successful} successful, {failed} failed, {skipped} skipped in {total_execution_time:.2f}s")
+        logger.info("[%s] Batch operation %s completed: %s successful, %s failed, %s skipped in %.2fs",
+                    context['request_id'], operation_id, successful, failed, skipped, total_execution_time)
         
-        return {"result": batch_response.model_dump()}
+        return {"result": batch_result}
         
     except Exception as e:
         return create_error_response(e, context, "batch job triggering")
@@ -2412,7 +3012,7 @@ def batch_monitor_jobs(operation_id: str) -> Dict[str, Any]:
         Current status of the batch operation and individual job statuses
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Monitoring batch operation {operation_id}")
+    logger.info("[%s] Monitoring batch operation %s", context['request_id'], operation_id)
     
     try:
         # Check if operation exists
@@ -2491,8 +3091,8 @@ def batch_monitor_jobs(operation_id: str) -> Dict[str, Any]:
             estimated_completion=None  # Could implement ETA calculation
         )
         
-        logger.info(f"[{context['request_id']}] Batch operation {operation_id} status: "
-                   f"{overall_status} ({progress_percentage:.1f}% complete)")
+        logger.info("[%s] Batch operation %s status: %s (%.1f%% complete)",
+                    context['request_id'], operation_id, overall_status, progress_percentage)
         
         return {"result": monitoring_response.model_dump()}
         
@@ -2512,7 +3112,7 @@ def batch_cancel_jobs(operation_id: str, cancel_running_builds: bool = False) ->
         Cancellation status and results
     """
     context = get_request_context()
-    logger.info(f"[{context['request_id']}] Cancelling batch operation {operation_id}")
+    logger.info("[%s] Cancelling batch operation %s", context['request_id'], operation_id)
     
     try:
         # Check if operation exists
@@ -2544,14 +3144,14 @@ def batch_cancel_jobs(operation_id: str, cancel_running_builds: bool = False) ->
                         if "error" not in build_status and build_status.get("building", False):
                             # TODO: Implement build cancellation API call
                             # For now, just log the attempt
-                            logger.info(f"[{context['request_id']}] Would cancel running build {job_name}#{build_number}")
+                            logger.info("[%s] Would cancel running build %s#%s", context['request_id'], job_name, build_number)
                             cancelled_jobs.append({
                                 "job_name": job_name,
                                 "build_number": build_number,
                                 "status": "cancellation_requested"
                             })
                     except Exception as e:
-                        logger.warning(f"[{context['request_id']}] Could not check/cancel build {job_name}#{build_number}: {e}")
+                        logger.warning("[%s] Could not check/cancel build %s#%s: %s", context['request_id'], job_name, build_number, e)
         
         return {
             "result": {
@@ -2568,8 +3168,7 @@ def batch_cancel_jobs(operation_id: str, cancel_running_builds: bool = False) ->
 @with_retry(max_retries=2, base_delay=0.5)  # Quick retries for health checks
 def _health_check_request():
     """Make the actual health check request to Jenkins."""
-    auth = get_jenkins_auth()
-    response = requests.get(f"{JenkinsConfig.URL}/api/json", auth=auth, timeout=JenkinsConfig.HEALTH_CHECK_TIMEOUT)
+    response = _SESSION.get(f"{_JENKINS_BASE_URL}/api/json", timeout=JenkinsConfig.HEALTH_CHECK_TIMEOUT)
     response.raise_for_status()
     return response
 
@@ -2607,7 +3206,7 @@ def get_cache_statistics() -> Dict[str, Any]:
             }
         }
     except Exception as e:
-        logger.error(f"Failed to get cache statistics: {e}")
+        logger.error("Failed to get cache statistics: %s", e)
         return {"error": "Failed to retrieve cache statistics", "details": str(e)}
 
 @mcp.tool() 
@@ -2634,6 +3233,7 @@ def clear_cache(cache_type: Optional[str] = None, job_name: Optional[str] = None
         elif cache_type == "all" or cache_type is None:
             # Clear all caches
             cache_manager.clear_all_caches()
+            _invalidate_job_tree()
             return {
                 "status": "success", 
                 "message": "All caches cleared successfully",
@@ -2657,7 +3257,7 @@ def clear_cache(cache_type: Optional[str] = None, job_name: Optional[str] = None
                     "valid_types": ["all", "static", "semi_static", "dynamic", "permanent", "short"]
                 }
     except Exception as e:
-        logger.error(f"Failed to clear cache: {e}")
+        logger.error("Failed to clear cache: %s", e)
         return {"status": "error", "message": "Failed to clear cache", "details": str(e)}
 
 @mcp.tool()
@@ -2700,17 +3300,21 @@ def warm_cache(operations: List[str] = None) -> Dict[str, Any]:
             "warmed_operations": len([r for r in results if r["status"] == "success"])
         }
     except Exception as e:
-        logger.error(f"Failed to warm cache: {e}")
+        logger.error("Failed to warm cache: %s", e)
         return {"status": "error", "message": "Failed to warm cache", "details": str(e)}
 
 @mcp.resource("status://health")
-def get_health() -> HealthCheckResponse:
+async def get_health() -> HealthCheckResponse:
     """
     Performs a health check on the server and its connection to Jenkins.
+    
+    The blocking request (and its retries) runs on the I/O pool so a slow or
+    unreachable Jenkins cannot stall the MCP event loop.
     """
     try:
         # Verify connection to Jenkins with retry logic
-        response = _health_check_request()
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(_IO_POOL, _health_check_request)
 
         # Check if we get a valid response
         if "x-jenkins" not in response.headers:
@@ -2720,7 +3324,7 @@ def get_health() -> HealthCheckResponse:
         return HealthCheckResponse(status="ok")
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return HealthCheckResponse(status="error", details=f"Failed to connect to Jenkins: {str(e)}")
 
 if __name__ == "__main__":
@@ -2730,13 +3334,13 @@ if __name__ == "__main__":
             sys.argv = [sys.argv[0]] + unknown
             mcp.run()
         else:
-            logger.info(f"Starting Jenkins MCP server in {args.transport} mode on port {args.port}")
+            logger.info("Starting Jenkins MCP server in %s mode on port %s", args.transport, args.port)
             sys.argv = [sys.argv[0]] + unknown
             mcp.run(transport=args.transport)
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Failed to start Jenkins MCP server: {e}")
+        logger.error("Failed to start Jenkins MCP server: %s", e)
         sys.exit(1)
 
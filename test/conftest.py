@@ -0,0 +1,11 @@
+"""Shared pytest setup: import the server module without a live Jenkins."""
+
+import os
+import sys
+
+# The server validates credentials at import time; point it at a closed port
+os.environ.setdefault("JENKINS_URL", "http://127.0.0.1:9")
+os.environ.setdefault("JENKINS_USER", "test-user")
+os.environ.setdefault("JENKINS_API_TOKEN", "test-token")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"))
@@ -0,0 +1,37 @@
+"""Tests for console log paging."""
+
+import pytest
+
+import jenkins_mcp_server_enhanced as server
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("data, expected", [
+    (b"", 0),
+    (b"plain ascii", 11),
+    # Complete sequences of 2, 3 and 4 bytes
+    ("é".encode(), 2),
+    ("✓".encode(), 3),
+    ("🚀".encode(), 4),
+    (b"ok " + "🚀".encode(), 7),
+    # Incomplete trailing sequences are dropped
+    (b"ok " + "é".encode()[:1], 3),
+    (b"ok " + "✓".encode()[:1], 3),
+    (b"ok " + "✓".encode()[:2], 3),
+    (b"ok " + "🚀".encode()[:1], 3),
+    (b"ok " + "🚀".encode()[:2], 3),
+    (b"ok " + "🚀".encode()[:3], 3),
+    # A complete character followed by a cut one
+    ("✓".encode() + "🚀".encode()[:3], 3),
+    # A tail of continuation bytes with no lead byte is left alone
+    (b"ok \x80\x80\x80\x80", 7),
+])
+def test_utf8_boundary(data, expected):
+    assert server._utf8_boundary(data) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_bytes", [0, -1])
+def test_get_console_log_rejects_non_positive_max_bytes(max_bytes):
+    with pytest.raises(ValueError):
+        server.get_console_log("app-build", 7, max_bytes=max_bytes)
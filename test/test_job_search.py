@@ -0,0 +1,202 @@
+"""Tests for job search pattern matching and the shared job tree crawl."""
+
+import fnmatch
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+import jenkins_mcp_server_enhanced as server
+
+
+NAMES = [
+    "", "a", "ab", "abc", "build", "Build-Main", "app-build", "app-build-test",
+    "team/api/deploy-prod", "team/api", "Team/Sub/test-unit", "test-unit",
+    "unit", "x*y", "a?b", "release-1.2", "mb/main", "deploy\nprod",
+]
+
+PATTERNS = [
+    "", "*", "**", "build", "build*", "*build", "*build*", "**build**",
+    "*-*", "app*test", "a?c", "?", "[ab]*", "*[!a]", "team/*", "team/api/*-prod",
+    "*/test-*", "release-1.?", "x*y", "BUILD*", "*Unit", "TEAM/sub/*",
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_compile_glob_matches_fnmatch(pattern):
+    match = server._compile_glob(pattern)
+    for name in NAMES:
+        lowered = name.lower()
+        assert match(lowered) == fnmatch.fnmatchcase(lowered, pattern.lower()), (pattern, name)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern, prefix", [
+    ("team/api/*-deploy", "team/api"),
+    ("team/*", "team"),
+    ("TEAM/sub/*", "TEAM/sub"),
+    ("team/ap*/x", "team"),
+    ("*/x", ""),
+    ("build*", ""),
+    ("team/api", "team"),
+    ("/x*", ""),
+    ("a//b*", ""),
+])
+def test_glob_folder_prefix(pattern, prefix):
+    assert server._glob_folder_prefix(pattern) == prefix
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_glob_folder_prefix_confines_every_match(pattern):
+    # Searches match lowercased names, so the prefix confines matches case-insensitively
+    prefix = server._glob_folder_prefix(pattern).lower()
+    if not prefix:
+        return
+    for name in NAMES:
+        lowered = name.lower()
+        if fnmatch.fnmatchcase(lowered, pattern.lower()):
+            assert lowered.startswith(prefix + "/"), (pattern, name)
+
+
+class FakeJenkins:
+    """Serves tree= job listings for a fixed hierarchy, resolving names case-insensitively like Jenkins."""
+
+    FOLDER = "com.cloudbees.hudson.plugins.folder.Folder"
+    MULTIBRANCH = "org.jenkinsci.plugins.workflow.multibranch.WorkflowMultiBranchProject"
+    JOB = "hudson.model.FreeStyleProject"
+
+    def __init__(self):
+        self.root = {"jobs": [
+            {"name": "app-build", "_class": self.JOB},
+            {"name": "Team", "_class": self.FOLDER, "jobs": [
+                {"name": "test-unit", "_class": self.JOB},
+            ]},
+            {"name": "mb", "_class": self.MULTIBRANCH, "jobs": [
+                {"name": "main", "_class": self.JOB},
+            ]},
+        ]}
+
+    def _lookup(self, path):
+        node, names = self.root, []
+        for part in path.split("/"):
+            node = next((child for child in node.get("jobs", ()) if child["name"].lower() == part.lower()), None)
+            if node is None:
+                return None
+            names.append(node["name"])
+        return dict(node, fullName="/".join(names))
+
+    def request(self, method, endpoint, context, is_job_specific=True, suffix=None,
+                allowed_statuses=(), **kwargs):
+        node = self._lookup(endpoint) if is_job_specific else self.root
+        response = requests.Response()
+        if node is None:
+            response.status_code = 404
+            if 404 not in allowed_statuses:
+                raise requests.exceptions.HTTPError(response=response)
+            return response
+        response.status_code = 200
+        response._content = json.dumps(node).encode()
+        return response
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("pattern, expected", [
+    ("Team/*", ["Team/test-unit"]),
+    # Jenkins finds 'team' too; full names must still use the real folder name
+    ("team/*", ["Team/test-unit"]),
+    ("*unit*", ["Team/test-unit"]),
+    # A multibranch project is listed as a job by a full crawl, so a scoped search must not list its branches
+    ("mb/*", []),
+    ("missing/*", []),
+])
+def test_scoped_search_matches_full_search(monkeypatch, pattern, expected):
+    monkeypatch.setattr(server, "jenkins_request", FakeJenkins().request)
+    server._invalidate_job_tree()
+    try:
+        assert [item["full_name"] for item in server.search_jobs(pattern)] == expected
+    finally:
+        server._invalidate_job_tree()
+
+
+@pytest.fixture
+def fresh_tree_cache():
+    server._invalidate_job_tree()
+    yield
+    server._invalidate_job_tree()
+
+
+def _sample_table():
+    table = server.JobTable()
+    table.append("app-build", "app-build", "job")
+    table.append("Team", "Team", "folder")
+    table.append("test-unit", "Team/test-unit", "job")
+    return table
+
+
+@pytest.mark.cache
+def test_concurrent_searches_share_one_crawl(monkeypatch, fresh_tree_cache):
+    crawls = []
+
+    def slow_crawl(path, context, max_depth, current_depth=0):
+        crawls.append(path)
+        time.sleep(0.2)
+        return _sample_table()
+
+    monkeypatch.setattr(server, "_collect_jobs_recursive", slow_crawl)
+
+    results = []
+    barrier = threading.Barrier(8)
+
+    def search():
+        barrier.wait()
+        results.append([item["full_name"] for item in server.search_jobs("*unit*")])
+
+    threads = [threading.Thread(target=search) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert crawls == [""]
+    assert results == [["Team/test-unit"]] * 8
+
+
+@pytest.mark.cache
+def test_crawl_started_before_invalidation_is_not_cached(monkeypatch, fresh_tree_cache):
+    release_stale = threading.Event()
+    stale_started = threading.Event()
+
+    def crawl(path, context, max_depth, current_depth=0):
+        if threading.current_thread().name == "stale":
+            stale_started.set()
+            release_stale.wait()
+        return _sample_table()
+
+    monkeypatch.setattr(server, "_collect_jobs_recursive", crawl)
+    context = server.get_request_context()
+
+    stale = threading.Thread(target=server._get_job_tree, args=(context, 10), name="stale")
+    stale.start()
+    stale_started.wait()
+    server._invalidate_job_tree()
+    fresh = server._get_job_tree(context, 10)
+    release_stale.set()
+    stale.join()
+
+    assert server._get_cached_tree(("", 10)) is fresh
+
+
+@pytest.mark.cache
+def test_storing_a_tree_evicts_expired_trees(monkeypatch, fresh_tree_cache):
+    monkeypatch.setattr(server, "_collect_jobs_recursive", lambda *args, **kwargs: _sample_table())
+    monkeypatch.setattr(server.JenkinsConfig, "TREE_CACHE_TTL", 0)
+    context = server.get_request_context()
+
+    server._get_job_tree(context, 5)
+    server._get_job_tree(context, 6)
+
+    assert list(server._tree_cache["entries"]) == [("", 6)]